@@ -0,0 +1,237 @@
+"""End-to-end benchmark of parsing and rendering large API responses.
+
+Each scenario runs the same pipeline as the corresponding command, timing every stage on its own
+(validation, formatting and printing), over synthetic payloads (see `payloads.py`). Stages of formatting functions
+are reported as well, from their profiling spans (e.g. `format.group_matches`), and aren't counted in the total.
+
+Usage:
+    python benchmarks/benchmark.py --output results.json
+    python benchmarks/benchmark.py --compare results.json   # report stages that regressed since the baseline
+    python benchmarks/benchmark.py --trusted                # decode payloads as cached responses (see `decoders`)
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "football_cli"))
+import rich_click as click
+from rich.console import Console
+from rich.table import Table
+from models import MatchSet, Standings, Team
+from output_formation import format_matches, format_standings, format_team
+from rows import MatchRow
+import payloads
+import profiling
+
+
+SCENARIOS = ["matches", "standings", "squad"]
+GROUP_BY = ["date", "competition", "season", "stage", "matchday", "group"]     # same as `football matches`
+HEADERS = ["time"]
+TRUSTED = False     # decode payloads without validation, as responses read from the cache are
+
+
+class StageTimer:
+    """Record how long each stage of a pipeline takes (in seconds)."""
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def __call__(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] = self.timings.get(stage, 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def profile(self, stage: str) -> Iterator[None]:
+        """Record how long a stage takes, along with the profiling spans recorded within it (as `<stage>.<span>`)."""
+        profiling.enable()
+        try:
+            with self(stage):
+                yield
+        finally:
+            profiling.disable()
+        for span in profiling.get_spans():
+            name = f"{stage}.{span.name}"
+            self.timings[name] = self.timings.get(name, 0.0) + span.duration
+
+
+def _console(width: int) -> Console:
+    """Return a console rendering ANSI output (as on a terminal) to memory."""
+    return Console(file=io.StringIO(), width=width, force_terminal=True, color_system="truecolor", legacy_windows=False)
+
+
+def run_matches(payload: dict[str, Any], width: int) -> dict[str, float]:
+    """Pipeline of `football matches` (see `output_formation.format_matches`)."""
+    timer = StageTimer()
+    with timer("validate"):
+        matches = MatchSet.from_response(payload, trusted=TRUSTED).matches
+
+    with timer("rows"):
+        matches = list(map(MatchRow, matches))
+
+    with timer.profile("format"):
+        output = format_matches(matches, group_by=GROUP_BY, headers=list(HEADERS))
+
+    with timer("print"):
+        _console(width).print(output, justify="center")
+    return timer.timings
+
+
+def run_standings(payload: dict[str, Any], width: int) -> dict[str, float]:
+    """Pipeline of `football competition <ID> standings`."""
+    timer = StageTimer()
+    with timer("validate"):
+        standings = Standings.from_response(payload, trusted=TRUSTED)
+    with timer.profile("format"):
+        output = format_standings(standings)
+    with timer("print"):
+        _console(width).print(output)
+    return timer.timings
+
+
+def run_squad(payload: dict[str, Any], width: int) -> dict[str, float]:
+    """Pipeline of `football team <ID>`."""
+    timer = StageTimer()
+    with timer("validate"):
+        team = Team.from_response(payload, trusted=TRUSTED)
+    with timer.profile("format"):
+        output = format_team(team)
+    with timer("print"):
+        _console(width).print(output)
+    return timer.timings
+
+
+def benchmark(run: Callable[[dict[str, Any], int], dict[str, float]], payload: dict[str, Any],
+              repeat: int, warmup: int, width: int) -> dict[str, dict[str, float]]:
+    """Run a pipeline several times and summarize the timing of each stage (in milliseconds)."""
+    for _ in range(warmup):
+        run(payload, width)
+    runs = [run(payload, width) for _ in range(repeat)]
+    for timings in runs:
+        timings["total"] = sum(timing for stage, timing in timings.items() if "." not in stage)   # without sub-stages
+
+    return {
+        stage: {
+            "min": min(t[stage] for t in runs) * 1000,
+            "median": statistics.median(t[stage] for t in runs) * 1000,
+            "mean": statistics.fmean(t[stage] for t in runs) * 1000,
+        }
+        for stage in runs[0]
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float, min_delta: float) -> list[tuple]:
+    """Compare median timings with a baseline.
+
+    :param threshold: relative slowdown above which a stage is considered to have regressed (0.1 for 10%)
+    :param min_delta: absolute slowdown (in milliseconds) below which differences are considered noise
+
+    :return: rows of (scenario, stage, baseline, current, change, regressed)
+    """
+    rows = []
+    for scenario, stages in results["scenarios"].items():
+        for stage, timing in stages.items():
+            try:
+                base = baseline["scenarios"][scenario][stage]["median"]
+            except KeyError:
+                continue
+            current = timing["median"]
+            change = (current - base) / base if base else 0.0
+            regressed = change > threshold and current - base > min_delta
+            rows.append((scenario, stage, base, current, change, regressed))
+    return rows
+
+
+def _print_results(results: dict[str, Any], comparison: Optional[list[tuple]]):
+    console = Console()
+    table = Table(title="Benchmark (ms)", header_style="bold dim")
+    for column in ["Scenario", "Stage", "Min", "Median", "Mean"]:
+        table.add_column(column, justify="left" if column in ["Scenario", "Stage"] else "right")
+    for scenario, stages in results["scenarios"].items():
+        for stage, timing in stages.items():
+            style = "bold" if stage == "total" else None
+            table.add_row(scenario, stage, *[f"{timing[key]:.1f}" for key in ["min", "median", "mean"]], style=style)
+    console.print(table)
+
+    if comparison is None:
+        return
+    table = Table(title="Comparison with baseline (median, ms)", header_style="bold dim")
+    for column in ["Scenario", "Stage", "Baseline", "Current", "Change"]:
+        table.add_column(column, justify="left" if column in ["Scenario", "Stage"] else "right")
+    for scenario, stage, base, current, change, regressed in comparison:
+        color = "red" if regressed else "green" if change < 0 else "white"
+        table.add_row(scenario, stage, f"{base:.1f}", f"{current:.1f}", f"[{color}]{change:+.1%}")
+    console.print(table)
+
+
+@click.command()
+@click.option("--scenario", "scenarios", type=click.Choice(SCENARIOS), multiple=True,
+              help="Scenarios to run (default is all of them).")
+@click.option("--matches", "match_count", type=click.IntRange(min=1), default=10_000, show_default=True,
+              help="Number of matches of the matches scenario.")
+@click.option("--groups", type=click.IntRange(min=1), default=50, show_default=True,
+              help="Number of groups of the standings scenario.")
+@click.option("--players", type=click.IntRange(min=1), default=100, show_default=True,
+              help="Number of players of the squad scenario.")
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True, help="Number of timed runs.")
+@click.option("--warmup", type=click.IntRange(min=0), default=1, show_default=True, help="Number of untimed runs.")
+@click.option("--width", type=click.IntRange(min=40), default=120, show_default=True, help="Console width.")
+@click.option("--trusted", is_flag=True,
+              help="Decode payloads without validation (as validated cached responses are).")
+@click.option("--output", type=click.Path(dir_okay=False), help="Save results to a JSON file.")
+@click.option("--compare", "baseline_path", type=click.Path(exists=True, dir_okay=False),
+              help="JSON results of a previous run to compare with (exits with 1 if any stage regressed).")
+@click.option("--threshold", type=click.FloatRange(min=0), default=0.1, show_default=True,
+              help="Relative slowdown considered a regression.")
+@click.option("--min-delta", type=click.FloatRange(min=0), default=1.0, show_default=True,
+              help="Absolute slowdown (ms) below which differences are ignored.")
+def main(scenarios, match_count, groups, players, repeat, warmup, width, trusted, output, baseline_path, threshold,
+         min_delta):
+    """Benchmark parsing and rendering of large API responses."""
+    global TRUSTED
+    TRUSTED = trusted
+    pipelines = {
+        "matches": (run_matches, lambda: payloads.match_set(match_count)),
+        "standings": (run_standings, lambda: payloads.cup_standings(groups)),
+        "squad": (run_squad, lambda: payloads.squad(players)),
+    }
+    results = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"matches": match_count, "groups": groups, "players": players, "repeat": repeat, "width": width,
+                       "trusted": trusted},
+        "scenarios": {},
+    }
+    for scenario in scenarios or SCENARIOS:
+        run, make_payload = pipelines[scenario]
+        payload = make_payload()
+        results["scenarios"][scenario] = benchmark(run, payload, repeat, warmup, width)
+
+    comparison = None
+    if baseline_path:
+        with open(baseline_path, "r") as f:
+            comparison = compare(results, json.load(f), threshold, min_delta)
+
+    _print_results(results, comparison)
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=4)
+
+    if comparison and any(row[-1] for row in comparison):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Synthetic API payloads (shaped like football-data.org v4 responses) for benchmarks.
+
+Payloads are generated from a fixed seed, so that every run benchmarks exactly the same data.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+
+START_DATE = datetime(2023, 5, 1)
+LEAGUES = {"PL": "Premier League", "PD": "Primera Division", "SA": "Serie A", "BL1": "Bundesliga", "FL1": "Ligue 1"}
+CUPS = {"CL": "UEFA Champions League", "EC": "European Championship"}
+KNOCKOUT_STAGES = ["LAST_16", "QUARTER_FINALS", "SEMI_FINALS", "FINAL"]
+POSITIONS = ["Goalkeeper", "Defence", "Midfield", "Offence"]
+
+
+def _team(id_: int) -> dict[str, Any]:
+    return {
+        "id": id_,
+        "name": f"Football Club {id_}",
+        "shortName": f"Club {id_}",
+        "tla": f"C{id_ % 100:02d}",
+        "crest": f"https://crests.football-data.org/{id_}.png",
+    }
+
+
+def _competition(code: str, name: str, type_: str) -> dict[str, Any]:
+    return {"id": 2000 + list({**LEAGUES, **CUPS}).index(code), "name": name, "code": code, "type": type_,
+            "emblem": f"https://crests.football-data.org/{code}.png"}
+
+
+def _season(year: int) -> dict[str, Any]:
+    return {"id": 1500 + year % 100, "startDate": f"{year}-08-11", "endDate": f"{year + 1}-05-19",
+            "currentMatchday": 34, "winner": None}
+
+
+def _score(rng: random.Random, status: str, stage: str) -> dict[str, Any]:
+    if status in ["SCHEDULED", "TIMED"]:
+        none = {"home": None, "away": None}
+        return {"winner": None, "duration": "REGULAR", "fullTime": none, "halfTime": none}
+
+    home, away = rng.randint(0, 4), rng.randint(0, 4)
+    score = {
+        "duration": "REGULAR",
+        "fullTime": {"home": home, "away": away},
+        "halfTime": {"home": home // 2, "away": away // 2},
+    }
+    if home == away and stage in KNOCKOUT_STAGES:
+        penalties = {"home": 5, "away": 4} if rng.random() < 0.5 else {"home": 3, "away": 4}
+        score.update(duration="PENALTY_SHOOTOUT", regularTime={"home": home, "away": away},
+                     extraTime={"home": 0, "away": 0}, penalties=penalties)
+        home, away = home + penalties["home"], away + penalties["away"]
+    score["winner"] = "HOME_TEAM" if home > away else "AWAY_TEAM" if away > home else "DRAW"
+    return score
+
+
+def match_set(count: int = 10_000, days: int = 15, seed: int = 0) -> dict[str, Any]:
+    """Return a `matches` response spanning some days across leagues and cups (like `matches --time-frame -7 7`)."""
+    rng = random.Random(seed)
+    competitions = [(_competition(code, name, "LEAGUE"), None) for code, name in LEAGUES.items()]
+    competitions += [(_competition(code, name, "CUP"), stage)
+                     for code, name in CUPS.items() for stage in ["GROUP_STAGE", *KNOCKOUT_STAGES]]
+    matches = []
+    for id_ in range(count):
+        competition, stage = rng.choice(competitions)
+        utc_date = START_DATE + timedelta(days=rng.randrange(days), hours=rng.choice([12, 15, 17, 19, 20]))
+        status = "FINISHED" if utc_date < START_DATE + timedelta(days=days // 2) \
+            else rng.choice(["IN_PLAY", "PAUSED", "TIMED", "SCHEDULED"])
+        home_id, away_id = rng.sample(range(1, 500), 2)
+        matches.append({
+            "area": {"id": 2072, "name": "England", "code": "ENG", "flag": None},
+            "competition": competition,
+            "season": _season(2022),
+            "id": 400_000 + id_,
+            "utcDate": utc_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "status": status,
+            "matchday": rng.randint(1, 38) if stage in [None, "GROUP_STAGE"] else None,
+            "stage": stage or "REGULAR_SEASON",
+            "group": f"GROUP_{rng.choice('ABCDEFGH')}" if stage == "GROUP_STAGE" else None,
+            "lastUpdated": "2023-05-16T08:20:00Z",
+            "homeTeam": _team(home_id),
+            "awayTeam": _team(away_id),
+            "score": _score(rng, status, stage),
+            "odds": {"msg": "Activate Odds-Package in User-Panel to retrieve odds."},
+            "referees": [{"id": 11_000 + id_ % 50, "name": f"Referee {id_ % 50}", "type": "REFEREE",
+                          "nationality": "England"}],
+        })
+    return {
+        "filters": {"dateFrom": "2023-05-01", "dateTo": "2023-05-15", "permission": "TIER_ONE"},
+        "resultSet": {"count": count, "competitions": ",".join([*LEAGUES, *CUPS]), "played": count // 2},
+        "matches": matches,
+    }
+
+
+def cup_standings(groups: int = 50, teams_per_group: int = 4, seed: int = 0) -> dict[str, Any]:
+    """Return a `competitions/<ID>/standings` response of a cup with many groups."""
+    rng = random.Random(seed)
+    standings = []
+    for group in range(groups):
+        table = []
+        for position in range(1, teams_per_group + 1):
+            won, draw, lost = rng.randint(0, 6), rng.randint(0, 6), rng.randint(0, 6)
+            goals_for, goals_against = rng.randint(0, 20), rng.randint(0, 20)
+            table.append({
+                "position": position,
+                "team": _team(group * teams_per_group + position),
+                "playedGames": won + draw + lost,
+                "form": None,
+                "won": won,
+                "draw": draw,
+                "lost": lost,
+                "points": won * 3 + draw,
+                "goalsFor": goals_for,
+                "goalsAgainst": goals_against,
+                "goalDifference": goals_for - goals_against,
+            })
+        standings.append({"stage": "GROUP_STAGE", "type": "TOTAL", "group": f"GROUP_{group + 1}", "table": table})
+    return {
+        "filters": {"season": "2022"},
+        "area": {"id": 2077, "name": "Europe", "code": "EUR", "flag": None},
+        "competition": _competition("CL", CUPS["CL"], "CUP"),
+        "season": _season(2022),
+        "standings": standings,
+    }
+
+
+def squad(players: int = 100, seed: int = 0) -> dict[str, Any]:
+    """Return a `teams/<ID>` response with a large squad."""
+    rng = random.Random(seed)
+    return {
+        **_team(65),
+        "area": {"id": 2072, "name": "England", "code": "ENG", "flag": None},
+        "address": "SportCity Manchester M11 3FF",
+        "website": "https://www.mancity.com",
+        "founded": 1880,
+        "clubColors": "Sky Blue / White",
+        "venue": "Etihad Stadium",
+        "runningCompetitions": [_competition("PL", LEAGUES["PL"], "LEAGUE")],
+        "coach": {"id": 11_619, "firstName": "Josep", "lastName": "Guardiola", "name": "Pep Guardiola",
+                  "dateOfBirth": "1971-01-18", "nationality": "Spain"},
+        "squad": [{
+            "id": 3_000 + id_,
+            "name": f"Player Number {id_}",
+            "position": rng.choice(POSITIONS),
+            "dateOfBirth": f"{rng.randint(1985, 2005)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "nationality": rng.choice(["England", "Spain", "Brazil", "Norway", "Belgium"]),
+            "shirtNumber": id_ % 99 + 1,
+        } for id_ in range(players)],
+        "lastUpdated": "2023-06-10T16:00:00Z",
+    }
@@ -0,0 +1,83 @@
+"""Cassettes: API responses recorded on disk to be replayed by the stand-in API server (`football_replay`).
+
+Set `FOOTBALL_CLI_RECORD=1` to record every response received from the API into the cassette directory,
+one JSON file per request (keyed by path and parameters, the same way the response cache is).
+"""
+
+import os
+import json
+import time
+from typing import Any, Optional
+from dotenv import load_dotenv
+from response_cache import ResponseCache
+from utils import DATA_DIR
+
+
+load_dotenv()
+CASSETTE_DIR = os.getenv("FOOTBALL_CLI_CASSETTE_DIR") or os.path.join(DATA_DIR, "cassettes")
+RECORD = os.getenv("FOOTBALL_CLI_RECORD") == "1"
+
+
+def get_key(path: str, params: dict[str, Any]) -> str:
+    """Return the cassette key of a request.
+
+    :param path: request path relative to the base URL
+    :param params: request parameters
+    """
+    return ResponseCache.get_key(path, ResponseCache.normalize_params(params))
+
+
+def record(path: str, params: dict[str, Any], status: int, body: str, latency: float,
+           cassette_dir: str = CASSETTE_DIR):
+    """Save a response to the cassette directory (atomically), replacing any previous recording of the same request.
+
+    :param path: request path relative to the base URL
+    :param params: request parameters
+    :param status: HTTP status code of the response
+    :param body: response body
+    :param latency: time it took to receive the response (in seconds)
+    """
+    cassette = {
+        "path": path,
+        "params": ResponseCache.normalize_params(params),
+        "status": status,
+        "latency": round(latency, 4),
+        "recorded_at": time.time(),
+        "body": body,
+    }
+    os.makedirs(cassette_dir, exist_ok=True)
+    filepath = os.path.join(cassette_dir, f"{get_key(path, params)}.json")
+    tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_filepath, "w") as f:
+        json.dump(cassette, f)
+    os.replace(tmp_filepath, filepath)
+
+
+def load_cassettes(cassette_dir: str = CASSETTE_DIR) -> dict[str, dict[str, Any]]:
+    """Load all cassettes of a directory.
+
+    :return: cassettes by key
+    """
+    cassettes = {}
+    if not os.path.isdir(cassette_dir):
+        return cassettes
+    for filename in sorted(os.listdir(cassette_dir)):
+        if not filename.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(cassette_dir, filename), "r") as f:
+                cassette = json.load(f)
+        except (OSError, ValueError):
+            continue
+        cassettes[filename.removesuffix(".json")] = cassette
+    return cassettes
+
+
+def find_similar(cassettes: dict[str, dict[str, Any]], path: str, params: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Find the latest cassette of the same path and parameter names (but different values).
+
+    Used to replay requests whose parameters depend on the current date (e.g. `--date today` or `--time-frame -3 4`).
+    """
+    names = sorted(params)
+    similar = [c for c in cassettes.values() if c["path"] == path and sorted(c["params"]) == names]
+    return max(similar, key=lambda c: c.get("recorded_at", 0), default=None)
@@ -1,13 +1,16 @@
 import rich_click as click
-from rich.console import Console
-from pydantic import ValidationError
+from functools import partial
 from options_validator import OptionsValidator
 from request_handler import RequestHandler
-from models import Competition, Standings, MatchSet, CompetitionTeams, TopScorers
-from output_formation import format_champions, format_standings, format_matches, format_teams, format_top_scorers
+from output_formation import format_champions, format_standings, format_matches, format_teams, format_top_scorers, stream_matches, TEAMS_FIELDS
 from options_callbacks import list_competitions_callback, competition_id_callback, date_callback, stage_callback, group_callback, time_frame_callback
 from exception_handling import APIResponseParsingError
-from utils import load_json
+from output_records import match_records, scorer_records, standing_records, team_records, write_records
+import plain
+import render_cache
+from parallel_rendering import render_matches
+from watch import validate_watch, watch_matches
+from utils import load_json, print_cached, print_output, print_rendered, print_stream
 
 
 OPTIONS = load_json("options.json")
@@ -26,19 +29,26 @@ def competition(ctx, competition_id, all):
     If no command provided, show champions of previous available seasons.
     """
     if not ctx.invoked_subcommand:
-        result = RequestHandler(
+        if ctx.find_root().params.get("output_format"):
+            raise click.UsageError("--output is only supported when listing matches, standings, scorers or teams.")
+
+        from pydantic import ValidationError
+        from models import Competition
+
+        handler = RequestHandler(
             path=f"competitions/{competition_id}",
             params=ctx.params.copy()
-        ).send_request()
+        )
+        handler.send_request()
 
         try:
-            competition = Competition(**result)
+            competition = handler.parse(Competition)
         except ValidationError as e:
             raise APIResponseParsingError(e)
 
         output = format_champions(competition)
 
-        Console().print(output, justify="center")
+        print_output(output, justify="center")
 
 
 @competition.command()
@@ -58,16 +68,30 @@ def standings(ctx, season, date):
     if errors := validator.errors:
         raise click.UsageError("\n".join(errors))
 
+    from models import Standings
+
     competition_id = ctx.parent.params['competition_id']
-    result = RequestHandler(
+    handler = RequestHandler(
         path=f"competitions/{competition_id}/standings",
         params=ctx.params.copy()
-    ).send_request()
+    )
+    result = handler.send_request()
+
+    cache = render_cache.for_command(ctx, "standings", result)
+    if print_cached(cache):
+        return
+
+    standings = handler.parse(Standings)
+    if output_format := ctx.find_root().params.get("output_format"):
+        write_records(standing_records(standings), output_format)
+        return
+    if ctx.find_root().params.get("plain"):
+        plain.write_standings(standings)
+        return
 
-    standings = Standings(**result)
     output = format_standings(standings)
 
-    Console().print(output, justify="center")
+    print_output(output, cache=cache, justify="center")
 
 
 @competition.command()
@@ -88,13 +112,14 @@ def standings(ctx, season, date):
 @click.option("--past", "status", flag_value="FINISHED", help="Show matches played so far in the current season.")
 @click.option("--upcoming", "status", flag_value="TIMED,SCHEDULED", help="Show matches scheduled for the rest of the season.")
 @click.option("--show-id", is_flag=True, help="Show match id used to get head-to-head matches summary (check matches --head2head).")
-def matches(ctx, season, matchday, stage, group, time_frame, status, show_id, dateFrom=None, dateTo=None):
+@click.option("--watch", is_flag=True, help="Only used with --live to keep showing live matches, updated as they change.")
+def matches(ctx, season, matchday, stage, group, time_frame, status, show_id, watch, dateFrom=None, dateTo=None):
     """Show competition matches.
 
     \b
     Mutually exclusive options:
         * --season and --time-frame
-        * --live/--past/--upcoming and all other options except for --show-id
+        * --live/--past/--upcoming and all other options except for --show-id (and --watch with --live)
         * --stage and --group/--matchday\b
           (By default, --stage is automatically considered GROUP_STAGE if --group/--matchday is specified)
     """
@@ -109,21 +134,50 @@ def matches(ctx, season, matchday, stage, group, time_frame, status, show_id, da
     validator.validate_options()
     if errors := validator.errors:
         raise click.UsageError("\n".join(errors))
+    if watch:
+        validate_watch(ctx, status)
+
+    from models import MatchSet
+    from rows import MatchRow
 
     competition_id = ctx.parent.params["competition_id"]
-    result = RequestHandler(
+    group_by = ["competition", "season", "stage", "matchday", "group"]
+    headers = ["date", "time"] + (["id"] if show_id else [])
+    if watch:
+        watch_matches(f"competitions/{competition_id}/matches", ctx.params.copy(),
+                      render=partial(format_matches, group_by=group_by, headers=headers))
+        return
+
+    handler = RequestHandler(
         path=f"competitions/{competition_id}/matches",
         params=ctx.params.copy()
-    ).send_request()
-
-    matches = MatchSet(**result).matches
-    output = format_matches(
-        matches,
-        group_by=["competition", "season", "stage", "matchday", "group"],
-        headers=["date", "time"] + (["id"] if show_id else [])
     )
+    result = handler.send_request()
+
+    cache = render_cache.for_command(ctx, "competition_matches", result, group_by=group_by, headers=headers, show_id=show_id)
+    if print_cached(cache):
+        return
+
+    matches = handler.parse(MatchSet).matches
+    if output_format := ctx.find_root().params.get("output_format"):
+        write_records(match_records(matches), output_format)
+        return
 
-    Console().print(output, justify="center")
+    matches = list(map(MatchRow, matches))
+    if ctx.find_root().params.get("plain"):
+        plain.write_matches(matches, group_by, headers)
+        return
+    if ctx.find_root().params.get("stream"):
+        print_stream(stream_matches(matches, group_by, headers), justify="center")
+        return
+    if (jobs := ctx.find_root().params.get("jobs", 1)) > 1 and (
+            rendered := render_matches(matches, group_by, headers, jobs=jobs)) is not None:
+        print_rendered(rendered, cache)
+        return
+
+    output = format_matches(matches, group_by=group_by, headers=headers)
+
+    print_output(output, cache=cache, justify="center")
 
 
 @competition.command()
@@ -131,16 +185,26 @@ def matches(ctx, season, matchday, stage, group, time_frame, status, show_id, da
 @click.option("--season", type=int, help="Season start year (default is the current season).")
 def teams(ctx, season):
     """List competing teams."""
+    from models import CompetitionTeams
+
     competition_id = ctx.parent.params["competition_id"]
-    result = RequestHandler(
+    handler = RequestHandler(
         path=f"competitions/{competition_id}/teams",
         params=ctx.params.copy()
-    ).send_request()
+    )
+    handler.send_request()
+
+    teams = handler.parse(CompetitionTeams, fields=TEAMS_FIELDS).teams
+    if output_format := ctx.find_root().params.get("output_format"):
+        write_records(team_records(teams), output_format)
+        return
+    if ctx.find_root().params.get("plain"):
+        plain.write_teams(teams)
+        return
 
-    teams = CompetitionTeams(**result).teams
     output = format_teams(teams)
 
-    Console().print(output, justify="center")
+    print_output(output, justify="center")
 
 
 @competition.command()
@@ -149,13 +213,26 @@ def teams(ctx, season):
 @click.option("--top", "-n", "limit", type=click.IntRange(min=1), default=5, show_default=True, help="Top n scorers.")
 def scorers(ctx, season, limit):
     """Show competition top scorers."""
+    from models import TopScorers
+    from rows import ScorerRow
+
     competition_id = ctx.parent.params["competition_id"]
-    result = RequestHandler(
+    handler = RequestHandler(
         path=f"competitions/{competition_id}/scorers",
         params=ctx.params.copy()
-    ).send_request()
+    )
+    handler.send_request()
+
+    scorers = handler.parse(TopScorers).scorers
+    if output_format := ctx.find_root().params.get("output_format"):
+        write_records(scorer_records(scorers), output_format)
+        return
+
+    scorers = list(map(ScorerRow, scorers))
+    if ctx.find_root().params.get("plain"):
+        plain.write_top_scorers(scorers)
+        return
 
-    scorers = TopScorers(**result).scorers
     output = format_top_scorers(scorers)
 
-    Console().print(output, justify="center")
+    print_output(output, justify="center")
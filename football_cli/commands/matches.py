@@ -1,10 +1,15 @@
 import rich_click as click
-from rich.console import Console
+from functools import partial
 from options_validator import OptionsValidator
 from request_handler import RequestHandler
-from models import MatchSet
-from output_formation import format_matches, format_h2h_matches
+from output_formation import format_matches, format_h2h_matches, stream_matches, H2H_FIELDS
 from options_callbacks import date_callback, time_frame_callback, last_h2h_callback
+from output_records import match_records, write_records
+import plain
+import render_cache
+from parallel_rendering import render_matches
+from watch import validate_watch, watch_matches
+from utils import print_cached, print_output, print_rendered, print_stream
 
 
 @click.command()
@@ -26,13 +31,14 @@ from options_callbacks import date_callback, time_frame_callback, last_h2h_callb
               help="Only used with --head2head to show summary of the last n matches.",
               callback=last_h2h_callback)
 @click.option("--show-id", is_flag=True, help="Show match id used to get head-to-head matches summary (check matches --head2head).")
-def matches(ctx, status, date, time_frame, competitions, head2head, limit, show_id, dateFrom=None, dateTo=None):
+@click.option("--watch", is_flag=True, help="Only used with --live to keep showing live matches, updated as they change.")
+def matches(ctx, status, date, time_frame, competitions, head2head, limit, show_id, watch, dateFrom=None, dateTo=None):
     """Show match scores.
 
     \b
     Mutually exclusive options:
     * --date and --time-frame
-    * --live and all other options except for --competitions and --show-id
+    * --live and all other options except for --competitions, --show-id and --watch
     * --head2head/--last and all other options
     """
     validator = OptionsValidator(
@@ -46,26 +52,59 @@ def matches(ctx, status, date, time_frame, competitions, head2head, limit, show_
     validator.validate_options()
     if errors := validator.errors:
         raise click.UsageError("\n".join(errors))
+    if watch:
+        validate_watch(ctx, status)
 
+    from models import MatchSet
+    from rows import MatchRow
+
+    output_format = ctx.find_root().params.get("output_format")
     if head2head:
-        result = RequestHandler(
+        if output_format:
+            raise click.UsageError("--output is only supported when listing matches, standings, scorers or teams.")
+        handler = RequestHandler(
             path=f"matches/{head2head}/head2head",
             params=ctx.params.copy()
-        ).send_request()
+        )
+        handler.send_request()
 
-        aggregates = MatchSet(**result).aggregates
+        aggregates = handler.parse(MatchSet, fields=H2H_FIELDS).aggregates
         output = format_h2h_matches(aggregates)
+        cache = None
     else:
-        result = RequestHandler(
+        group_by = ["date", "competition", "season", "stage", "matchday", "group"]
+        headers = ["time"] + (["id"] if show_id else [])
+        if watch:
+            watch_matches("matches", ctx.params.copy(), render=partial(format_matches, group_by=group_by, headers=headers))
+            return
+
+        handler = RequestHandler(
             path=f"matches",
             params=ctx.params.copy()
-        ).send_request()
-
-        matches = MatchSet(**result).matches
-        output = format_matches(
-            matches,
-            group_by=["date", "competition", "season", "stage", "matchday", "group"],
-            headers=["time"] + (["id"] if show_id else [])
         )
+        result = handler.send_request()
+
+        cache = render_cache.for_command(ctx, "matches", result, group_by=group_by, headers=headers, show_id=show_id)
+        if print_cached(cache):
+            return
+
+        matches = handler.parse(MatchSet).matches
+        if output_format:
+            write_records(match_records(matches), output_format)
+            return
+
+        matches = list(map(MatchRow, matches))
+        if ctx.find_root().params.get("plain"):
+            plain.write_matches(matches, group_by, headers)
+            return
+        if ctx.find_root().params.get("stream"):     # day by day
+            print_stream(stream_matches(matches, group_by, headers), justify="center")
+            return
+        if (jobs := ctx.find_root().params.get("jobs", 1)) > 1 and (
+                rendered := render_matches(matches, group_by, headers, jobs=jobs)) is not None:
+            print_rendered(rendered, cache)
+            return
+
+        output = format_matches(matches, group_by=group_by, headers=headers)
 
-    Console().print(output, justify="center")
+    print_output(output, cache=cache, justify="center")
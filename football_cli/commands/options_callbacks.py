@@ -1,10 +1,12 @@
 import os
 from rich.console import Console
 from rich_click import Context, Parameter, ClickException, BadParameter, UsageError, Choice, prompt, style
-from utils import to_isoformat, date_from_offset, load_json
-from output_formation import format_competitions_list, format_teams_list
+from utils import to_isoformat, date_from_offset
+from data_index import get_index
+from profiling import profiled
 
 
+@profiled("callbacks")
 def group_callback(ctx: Context, param: Parameter, group: str | tuple[str] | None) -> str | None:
     """Prefix group number with 'GROUP_' and concatenate groups if many."""
     if group is None:
@@ -14,6 +16,7 @@ def group_callback(ctx: Context, param: Parameter, group: str | tuple[str] | Non
     return ",".join([f"GROUP_{g.upper()}" for g in group])
 
 
+@profiled("callbacks")
 def stage_callback(ctx: Context, param: Parameter, stage: str | tuple[str] | None) -> str | None:
     """Concatenate stages if many."""
     if stage is None:
@@ -25,6 +28,7 @@ def stage_callback(ctx: Context, param: Parameter, stage: str | tuple[str] | Non
     return ",".join(stage)
 
 
+@profiled("callbacks")
 def date_callback(ctx: Context, param: Parameter, date_: str | None) -> str | None:
     """Convert date string to upper case if one of ("today", "yesterday", "tomorrow") or to ISO format otherwise.
     
@@ -40,6 +44,7 @@ def date_callback(ctx: Context, param: Parameter, date_: str | None) -> str | No
         raise BadParameter(f"{date_!r} is not a valid date.")
 
 
+@profiled("callbacks")
 def last_callback(ctx: Context, param: Parameter, last: int | None) -> int | None:
     """Set context parameter `status` to 'FINISHED,LIVE' if last matches for a team are requested."""
     if last is None:
@@ -48,6 +53,7 @@ def last_callback(ctx: Context, param: Parameter, last: int | None) -> int | Non
     return last
 
 
+@profiled("callbacks")
 def next_callback(ctx: Context, param: Parameter, next: int | None) -> int | None:
     """Set context parameter `status` to 'TIMED,SCHEDULED' if next matches for a team are requested."""
     if next is None:
@@ -56,6 +62,7 @@ def next_callback(ctx: Context, param: Parameter, next: int | None) -> int | Non
     return next
 
 
+@profiled("callbacks")
 def last_h2h_callback(ctx: Context, param: Parameter, last: int | None) -> int | None:
     """Make sure `--last` is used with `--head2head` and set its default value.
     
@@ -69,6 +76,7 @@ def last_h2h_callback(ctx: Context, param: Parameter, last: int | None) -> int |
     return last
 
 
+@profiled("callbacks")
 def time_frame_callback(ctx: Context, param: Parameter, time_frame: tuple[str, str] | None) -> tuple[str, str] | None:
     """Parse and validate time frame and set context parameters `dateFrom` and `dateTo`.
     
@@ -96,6 +104,7 @@ def time_frame_callback(ctx: Context, param: Parameter, time_frame: tuple[str, s
     return time_frame
 
 
+@profiled("callbacks")
 def team_id_callback(ctx: Context, param: Parameter, tla: str) -> int | None:
     """Map team name TLA (Three-Letter Abbreviation) to team ID.
     
@@ -105,14 +114,13 @@ def team_id_callback(ctx: Context, param: Parameter, tla: str) -> int | None:
         return
     
     tla = tla.upper()
-    AVAILABLE_TEAMS = load_json("teams.json")
-    if tla not in AVAILABLE_TEAMS:
+    teams_dict: dict[int, dict] = get_index().teams_by_tla.get(tla)
+    if not teams_dict:
         raise BadParameter("No such team. Check available teams using '--all' flag.")
     
-    teams_dict: dict[str, dict] = AVAILABLE_TEAMS[tla]
     ids = list(teams_dict.keys())
     if len(ids) == 1:
-        return int(ids[0])
+        return ids[0]
     
     teams = list(teams_dict.values())    
     message = style("Multiple teams with the same code, please choose one of the teams below:\n", fg="yellow")
@@ -122,9 +130,10 @@ def team_id_callback(ctx: Context, param: Parameter, tla: str) -> int | None:
     i = prompt(message, type=Choice(list(map(str, range(1, len(teams) + 1)))))
     team_id = ids[int(i) - 1]
     
-    return int(team_id)
+    return team_id
 
 
+@profiled("callbacks")
 def competition_id_callback(ctx: Context, param: Parameter, code: str) -> str | None:
     """Convert competition id (code) to upper case.
     
@@ -136,13 +145,13 @@ def competition_id_callback(ctx: Context, param: Parameter, code: str) -> str |
         return code
     
     code = code.upper()
-    AVAILABLE_COMPETITIONS = load_json("competitions.json")
-    if code not in AVAILABLE_COMPETITIONS:
+    if code not in get_index().competitions:
         raise BadParameter("No such competition. Check available competition using '--all' flag.")
     
     return code
 
 
+@profiled("callbacks")
 def list_competitions_callback(ctx: Context, param: Parameter, value: bool):
     """List available competitions and exit.
     
@@ -151,6 +160,14 @@ def list_competitions_callback(ctx: Context, param: Parameter, value: bool):
     if not value:
         return
     
+    if ctx.find_root().params.get("plain"):
+        from plain import write_index_list
+
+        write_index_list("competitions")
+        ctx.exit(0)
+
+    from output_formation import format_competitions_list
+
     competitions = format_competitions_list()
     if len(competitions.rows) == 0:
         raise ClickException("\n".join([
@@ -163,6 +180,7 @@ def list_competitions_callback(ctx: Context, param: Parameter, value: bool):
     ctx.exit(0)
 
 
+@profiled("callbacks")
 def list_teams_callback(ctx: Context, param: Parameter, value: bool):
     """List available teams and exit.
     
@@ -171,6 +189,14 @@ def list_teams_callback(ctx: Context, param: Parameter, value: bool):
     if not value:
         return
     
+    if ctx.find_root().params.get("plain"):
+        from plain import write_index_list
+
+        write_index_list("teams")
+        ctx.exit(0)
+
+    from output_formation import format_teams_list
+
     teams = format_teams_list()
     if len(teams.rows) == 0:
         raise ClickException("\n".join([
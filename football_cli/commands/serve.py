@@ -0,0 +1,21 @@
+import rich_click as click
+from daemon import SOCKET_PATH, is_running, serve as serve_forever
+
+
+@click.command()
+@click.pass_context
+@click.option("--socket", "socket_path", type=str, default=SOCKET_PATH, show_default=True,
+              help="Unix socket to listen on (clients use FOOTBALL_CLI_SOCKET to find it).")
+def serve(ctx, socket_path):
+    """Run a resident daemon to make commands faster.
+
+    While the daemon is running, `football` commands are forwarded to it,
+    so that they don't pay for starting the interpreter, loading modules and opening new connections.
+    Interactive prompts aren't supported by commands run through the daemon.
+    Set FOOTBALL_CLI_NO_DAEMON=1 to bypass it.
+    """
+    if is_running(socket_path):
+        raise click.ClickException(f"A daemon is already listening on {socket_path}")
+
+    click.echo(f"Listening on {socket_path} (press Ctrl+C to stop)")
+    serve_forever(ctx.find_root().command, socket_path)
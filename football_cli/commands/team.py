@@ -1,10 +1,12 @@
 import rich_click as click
-from rich.console import Console
 from options_validator import OptionsValidator
 from request_handler import RequestHandler
-from models import Team, MatchSet
-from output_formation import format_team, format_team_matches
+from output_formation import format_team, format_team_matches, TEAM_FIELDS
 from options_callbacks import list_teams_callback, team_id_callback, time_frame_callback, last_callback, next_callback
+from output_records import match_records, write_records
+import plain
+import render_cache
+from utils import print_cached, print_output
 
 
 @click.group(invoke_without_command=True)
@@ -19,15 +21,25 @@ def team(ctx, team_id, all):
     """
     ctx.params["team_id"] = int(ctx.params["team_id"])
     if not ctx.invoked_subcommand:
-        result = RequestHandler(
+        if ctx.find_root().params.get("output_format"):
+            raise click.UsageError("--output is only supported when listing matches, standings, scorers or teams.")
+
+        from models import Team
+
+        handler = RequestHandler(
             path=f"teams/{team_id}",
             params=ctx.params.copy()
-        ).send_request()
+        )
+        handler.send_request()
+
+        team = handler.parse(Team, fields=TEAM_FIELDS)
+        if ctx.find_root().params.get("plain"):
+            plain.write_team(team)
+            return
 
-        team = Team(**result)
         output = format_team(team)
 
-        Console().print(output, justify="center")
+        print_output(output, justify="center")
 
 
 @team.command()
@@ -69,17 +81,34 @@ def matches(ctx, season, competitions, venue, time_frame, limit, next, show_id,
     if errors := validator.errors:
         raise click.UsageError("\n".join(errors))
 
+    from models import MatchSet
+    from rows import MatchRow
+
     team_id = ctx.parent.params["team_id"]
-    result = RequestHandler(
+    handler = RequestHandler(
         path=f"teams/{team_id}/matches",
         params=ctx.params.copy()
-    ).send_request()
-
-    matches = MatchSet(**result).matches[:next]
-    output = format_team_matches(
-        team_id=team_id, matches=matches,
-        group_by=["competition", "season", "stage", "group"],
-        headers=["date", "time"] + (["id"] if show_id else [])
     )
+    result = handler.send_request()
+
+    group_by = ["competition", "season", "stage", "group"]
+    headers = ["date", "time"] + (["id"] if show_id else [])
+    cache = render_cache.for_command(ctx, "team_matches", result, team_id=team_id, next=next, group_by=group_by,
+                                     headers=headers, show_id=show_id)
+    if print_cached(cache):
+        return
+
+    matches = handler.parse(MatchSet).matches[:next]
+    if output_format := ctx.find_root().params.get("output_format"):
+        write_records(match_records(matches), output_format)
+        return
+
+    matches = list(map(MatchRow, matches))
+    if ctx.find_root().params.get("plain"):
+        plain.write_matches(matches, group_by, headers)
+        plain.write_team_stats(team_id, matches)
+        return
+
+    output = format_team_matches(team_id=team_id, matches=matches, group_by=group_by, headers=headers)
 
-    Console().print(output, justify="center")
+    print_output(output, cache=cache, justify="center")
@@ -0,0 +1,149 @@
+"""Fast path of shell completion.
+
+Completing through `click` means loading the whole CLI on every TAB press, so the most common completions
+(commands, competition IDs, team TLAs, stages and groups) are served from the data directory here,
+with nothing heavier than the data index being imported.
+Anything else (e.g. option names) falls back to the regular `click` completion.
+
+Note that command names and help texts below need to be kept in sync with the `click` commands.
+"""
+
+import os
+import shlex
+from typing import Optional
+from data_index import get_index
+from utils import load_json
+
+
+COMMANDS = {
+    "competition": "Show competition info.",
+    "matches": "Show match scores.",
+    "serve": "Run a resident daemon to make commands faster.",
+    "team": "Show team info.",
+}
+SUBCOMMANDS = {
+    "competition": {
+        "matches": "Show competition matches.",
+        "scorers": "Show competition top scorers.",
+        "standings": "Show competition standings.",
+        "teams": "List competing teams.",
+    },
+    "team": {
+        "matches": "Show team matches.",
+    },
+}
+GLOBAL_OPTIONS_WITH_VALUES = ["--api-key", "--output", "--jobs", "-j", "--profile-trace"]
+
+Completion = tuple[str, Optional[str]]     # value, help
+
+
+def _split_args(string: str) -> list[str]:
+    """Split command line into words (an unclosed quote is considered part of the last word)."""
+    lexer = shlex.shlex(string, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    words = []
+    try:
+        for word in lexer:
+            words.append(word)
+    except ValueError:
+        words.append(lexer.token)
+    return words
+
+
+def get_completion_args(shell: str) -> tuple[list[str], str]:
+    """Return complete args and the incomplete value from the environment variables set by the completion script."""
+    words = _split_args(os.environ["COMP_WORDS"])
+    if shell == "fish":
+        incomplete = os.environ["COMP_CWORD"]
+        args = words[1:]
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+        return args, incomplete
+
+    cword = int(os.environ["COMP_CWORD"])
+    args = words[1:cword]
+    incomplete = words[cword] if cword < len(words) else ""
+    return args, incomplete
+
+
+def _filter(choices: dict[str, Optional[str]], incomplete: str) -> list[Completion]:
+    incomplete = incomplete.upper()
+    return [(value, help_) for value, help_ in choices.items() if value.upper().startswith(incomplete)]
+
+
+def get_completions(args: list[str], incomplete: str) -> Optional[list[Completion]]:
+    """Return completions or `None` if they can't be determined without `click`."""
+    if incomplete.startswith("-"):
+        return None
+
+    if args and args[-1] in ["--stage", "--group"]:
+        options = load_json("options.json")
+        choices = options.get("stages") if args[-1] == "--stage" else options.get("groups")
+        return _filter(dict.fromkeys(choices), incomplete) if choices else None
+
+    words = []      # positional arguments (skipping global options)
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg in GLOBAL_OPTIONS_WITH_VALUES:
+            skip = True
+        elif arg.startswith("-"):
+            if words:   # command options, leave the rest to click
+                return None
+        else:
+            words.append(arg)
+    if skip:        # completing a value of a global option
+        return None
+
+    if not words:
+        return _filter(COMMANDS, incomplete)
+
+    command, arguments = words[0], words[1:]
+    if command not in SUBCOMMANDS:
+        return None
+
+    if not arguments:
+        index = get_index()
+        if command == "competition":
+            return _filter({code: c["name"] for code, c in index.competitions.items()}, incomplete)
+        return _filter({tla: ", ".join(t["full_name"] for t in teams.values())
+                        for tla, teams in index.teams_by_tla.items()}, incomplete)
+
+    if len(arguments) == 1:
+        return _filter(SUBCOMMANDS[command], incomplete)
+
+    return None
+
+
+def format_completion(shell: str, value: str, help_: Optional[str]) -> str:
+    """Format a completion item the same way `click` does for each shell."""
+    if shell == "zsh":
+        return f"plain\n{value}\n{help_ or '_'}"
+    if shell == "fish" and help_:
+        return f"plain,{value}\t{help_}"
+    return f"plain,{value}"
+
+
+def complete(complete_var: str = "_FOOTBALL_COMPLETE") -> bool:
+    """Print completions if they can be served by the fast path.
+
+    :param complete_var: environment variable holding the completion instruction (e.g. `bash_complete`)
+
+    :return: `True` if completions were printed, `False` if `click` should handle the completion instead
+    """
+    shell, _, instruction = os.environ.get(complete_var, "").partition("_")
+    if instruction != "complete" or shell not in ["bash", "zsh", "fish"]:
+        return False
+
+    try:
+        args, incomplete = get_completion_args(shell)
+    except (KeyError, ValueError):
+        return False
+    completions = get_completions(args, incomplete)
+    if completions is None:
+        return False
+
+    print("\n".join(format_completion(shell, value, help_) for value, help_ in completions))
+    return True
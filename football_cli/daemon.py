@@ -0,0 +1,314 @@
+"""Resident daemon (`football serve`) and the thin client used by the `football` entry point.
+
+The daemon keeps the CLI loaded (models, data index, HTTP connection pool, response cache and rate limiter)
+and runs commands forwarded over a Unix socket, one at a time, streaming their output back to the client.
+Commands run in the client's working directory. Settings read from the environment when modules are loaded
+(e.g. `FOOTBALL_CLI_BASE_URL` or `USE_RESPONSE_CACHE`) can't be changed per command, so a client whose settings differ
+from the daemon's runs the command itself, as does a client connecting while the daemon is busy.
+
+Protocol: both sides exchange frames made of a 1-byte type, a 4-byte (big-endian) payload length and the payload.
+    * Client -> daemon: `R` (request: JSON with argv, working directory, settings and the client's terminal environment)
+    * Daemon -> client: `O` (stdout data), `E` (stderr data), `X` (exit code) or `L` (run the command locally)
+"""
+
+import os
+import sys
+import json
+import stat
+import socket
+import struct
+import threading
+from typing import Optional
+
+
+SOCKET_PATH = os.getenv("FOOTBALL_CLI_SOCKET") or os.path.join(
+    os.getenv("XDG_RUNTIME_DIR") or os.getenv("TMPDIR") or "/tmp",
+    f"football-cli-{os.getuid() if hasattr(os, 'getuid') else 0}.sock"
+)
+
+# Client environment variables that affect the output of a command (applied to each command)
+FORWARDED_ENV = ["TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR", "FOOTBALL_CLI_API_KEY", "COLUMNS", "LINES"]
+
+# Environment variables read when modules are loaded (along with other `FOOTBALL_CLI_*` variables),
+# which must have the same values in the client and the daemon
+SETTINGS_ENV = ["USE_RESPONSE_CACHE", "USE_RENDER_CACHE", "SAVE_API_RESPONSE", "SHOW_REQUEST_TIMING", "SHOW_ERROR_DETAILS"]
+CLIENT_ENV = ["FOOTBALL_CLI_SOCKET", "FOOTBALL_CLI_NO_DAEMON"]     # only used by the client
+
+_HEADER = struct.Struct(">cI")
+
+
+def _send_frame(sock: socket.socket, type_: bytes, payload: bytes):
+    sock.sendall(_HEADER.pack(type_, len(payload)) + payload)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        data += chunk
+    return data
+
+
+def _recv_frame(sock: socket.socket) -> tuple[bytes, bytes]:
+    type_, size = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))
+    return type_, _recv_exactly(sock, size)
+
+
+def settings() -> dict[str, str]:
+    """Return the environment variables of the current process that must match between the client and the daemon."""
+    return {
+        key: value for key, value in os.environ.items()
+        if (key in SETTINGS_ENV or key.startswith("FOOTBALL_CLI_")) and key not in FORWARDED_ENV + CLIENT_ENV
+    }
+
+
+def is_running(socket_path: str = SOCKET_PATH) -> bool:
+    """Check whether a daemon is listening on the socket."""
+    if not os.path.exists(socket_path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# Client
+# --------------------------------------------------------------------------------------------------------------------
+
+def _is_owned(socket_path: str) -> bool:
+    """Check that a socket belongs to the current user and that no one else can access it."""
+    try:
+        st = os.lstat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid() and stat.S_IMODE(st.st_mode) & 0o077 == 0
+
+
+def _is_peer_owned(sock: socket.socket) -> bool:
+    """Check that the process on the other end of a connected socket runs as the current user (where supported)."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def forward(argv: list[str], socket_path: str = SOCKET_PATH) -> Optional[int]:
+    """Run a command through the daemon if it's running.
+
+    The request (which includes the API key) is only sent to a socket owned by the current user,
+    and only accessible to them, so that other local users can't impersonate the daemon.
+
+    :param argv: command line arguments (without the program name)
+
+    :return: exit code of the command, or `None` if it must be run locally (the daemon isn't running, can't be trusted,
+        is busy or has different settings)
+    """
+    if os.getenv("FOOTBALL_CLI_NO_DAEMON") == "1" or not hasattr(os, "getuid") or not _is_owned(socket_path):
+        return None
+    from dotenv import load_dotenv
+
+    load_dotenv()   # the daemon's settings include the `.env` file too
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        if not _is_peer_owned(sock):
+            sock.close()
+            return None
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        env = {key: os.environ[key] for key in FORWARDED_ENV if key in os.environ}
+        if sys.stdout.isatty():
+            size = os.get_terminal_size(sys.stdout.fileno())
+            env["COLUMNS"], env["LINES"] = str(size.columns), str(size.lines)
+        request = {"argv": argv, "cwd": os.getcwd(), "settings": settings(), "env": env, "isatty": sys.stdout.isatty()}
+        _send_frame(sock, b"R", json.dumps(request).encode())
+
+        while True:
+            try:
+                type_, payload = _recv_frame(sock)
+            except ConnectionError:
+                return 1
+            if type_ == b"O":
+                sys.stdout.buffer.write(payload)
+                sys.stdout.buffer.flush()
+            elif type_ == b"E":
+                sys.stderr.buffer.write(payload)
+                sys.stderr.buffer.flush()
+            elif type_ == b"X":
+                return int(payload)
+            elif type_ == b"L":
+                return None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# Daemon
+# --------------------------------------------------------------------------------------------------------------------
+
+class _FrameWriter:
+    """Text stream sending whatever is written to it as frames of a specific type."""
+
+    encoding = "utf-8"
+    errors = "replace"
+
+    def __init__(self, sock: socket.socket, type_: bytes, isatty: bool):
+        self.sock = sock
+        self.type_ = type_
+        self._isatty = isatty
+        self._lock = threading.Lock()   # rich status spinner writes from its own thread
+
+    def write(self, text: str | bytes) -> int:
+        if text:
+            data = text if isinstance(text, bytes) else text.encode(self.encoding, self.errors)
+            with self._lock:
+                _send_frame(self.sock, self.type_, data)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+    def fileno(self) -> int:
+        raise OSError("Not a real file")
+
+
+_index_mtimes: Optional[dict[str, int]] = None     # modification times of data files when the index was loaded
+
+
+def _load_index():
+    """Load the data index, or reload it if data files were changed since it was loaded."""
+    global _index_mtimes
+    from data_index import _source_mtimes, get_index
+
+    mtimes = _source_mtimes()
+    if mtimes != _index_mtimes:
+        get_index.cache_clear()
+        get_index()
+        _index_mtimes = mtimes
+
+
+def _preload(cli):
+    """Load everything that is otherwise loaded lazily by the CLI."""
+    import click
+    import models   # noqa: F401 (forward references are resolved on import)
+    from http_session import get_session
+
+    ctx = click.Context(cli)
+    for name in cli.list_commands(ctx):
+        cli.get_command(ctx, name)
+    _load_index()
+    get_session()
+
+
+def _run_command(cli, request: dict, sock: socket.socket) -> Optional[int]:
+    """Run a forwarded command with the client's environment and stream its output back.
+
+    :return: exit code of the command, or `None` if the daemon can't access the client's working directory
+    """
+    import io
+
+    saved_cwd = os.getcwd()
+    try:
+        os.chdir(request.get("cwd", saved_cwd))
+    except OSError:
+        return None
+
+    saved_streams = sys.stdout, sys.stderr, sys.stdin
+    client_env = request.get("env", {})
+    saved_env = {key: os.environ.get(key) for key in FORWARDED_ENV}
+    for key in FORWARDED_ENV:
+        if key in client_env:
+            os.environ[key] = client_env[key]
+        elif key != "FOOTBALL_CLI_API_KEY":     # fall back to the daemon's key
+            os.environ.pop(key, None)
+    os.environ.setdefault("COLUMNS", "80")
+    os.environ.setdefault("LINES", "25")
+
+    sys.stdout = _FrameWriter(sock, b"O", request.get("isatty", False))
+    sys.stderr = _FrameWriter(sock, b"E", request.get("isatty", False))
+    sys.stdin = io.StringIO("")     # interactive prompts aren't supported through the daemon
+    try:
+        _load_index()
+        cli.main(args=request["argv"], prog_name="football")
+        return 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        import traceback
+
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.stdout, sys.stderr, sys.stdin = saved_streams
+        os.chdir(saved_cwd)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def serve(cli, socket_path: str = SOCKET_PATH):
+    """Listen on a Unix socket and run forwarded commands one at a time until interrupted.
+
+    Connections are handled in threads, so that clients connecting while a command is running are told to run
+    their command locally instead of waiting for it.
+
+    :param cli: root command of the CLI
+    """
+    import socketserver
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)      # stale socket left behind by a daemon that didn't exit cleanly
+
+    _preload(cli)
+    daemon_settings = settings()
+    busy = threading.Lock()
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            try:
+                type_, payload = _recv_frame(self.request)
+                if type_ != b"R":
+                    return
+                request = json.loads(payload)
+                if request.get("settings") != daemon_settings or not busy.acquire(blocking=False):
+                    _send_frame(self.request, b"L", b"")
+                    return
+                try:
+                    code = _run_command(cli, request, self.request)
+                finally:
+                    busy.release()
+                if code is None:
+                    _send_frame(self.request, b"L", b"")
+                else:
+                    _send_frame(self.request, b"X", str(code).encode())
+            except (ConnectionError, BrokenPipeError):
+                pass    # client went away
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    umask = os.umask(0o077)     # the socket is only accessible to the current user as soon as it's bound
+    try:
+        server = Server(socket_path, Handler)
+    finally:
+        os.umask(umask)
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
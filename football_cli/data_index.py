@@ -0,0 +1,106 @@
+"""Precompiled lookup index of the data directory.
+
+Parsing `teams.json` and `competitions.json` on every lookup is wasteful, so both files are compiled into
+a `marshal` snapshot (`data/index.bin`) which is rebuilt whenever any of them is modified.
+"""
+
+import os
+import sys
+import marshal
+from functools import lru_cache
+from typing import Any, NamedTuple
+from utils import DATA_DIR, load_json
+
+
+INDEX_FILE = os.path.join(DATA_DIR, "index.bin")
+SOURCE_FILES = ["teams.json", "competitions.json"]
+INDEX_VERSION = 1
+
+
+class DataIndex(NamedTuple):     # not a dataclass, to keep imports minimal for shell completion
+    teams_by_tla: dict[str, dict[int, dict[str, Any]]]  # TLA -> team ID -> team info
+    teams_by_id: dict[int, dict[str, Any]]              # team ID -> team info (including TLA)
+    competitions: dict[str, dict[str, Any]]             # competition code -> competition info (zones, position colors, ...)
+
+    def team_ids(self, tla: str) -> list[int]:
+        return list(self.teams_by_tla.get(tla, {}))
+
+    def position_colors(self, code: str) -> dict[str, str]:
+        return self.competitions.get(code, {}).get("position_colors", {})
+
+    def zones(self, code: str) -> list[dict[str, Any]]:
+        return self.competitions.get(code, {}).get("zones", [])
+
+
+def _source_mtimes() -> dict[str, int]:
+    mtimes = {}
+    for filename in SOURCE_FILES:
+        try:
+            mtimes[filename] = os.stat(os.path.join(DATA_DIR, filename)).st_mtime_ns
+        except OSError:
+            mtimes[filename] = 0
+    return mtimes
+
+
+def build_index() -> DataIndex:
+    """Build the index from the JSON data files."""
+    teams = load_json("teams.json")
+    teams_by_tla = {
+        tla: {int(id_): team for id_, team in teams_dict.items()}
+        for tla, teams_dict in teams.items()
+    }
+    teams_by_id = {
+        id_: {**team, "tla": tla}
+        for tla, teams_dict in teams_by_tla.items()
+        for id_, team in teams_dict.items()
+    }
+    return DataIndex(
+        teams_by_tla=teams_by_tla,
+        teams_by_id=teams_by_id,
+        competitions=load_json("competitions.json"),
+    )
+
+
+def save_index(index: DataIndex, mtimes: dict[str, int] | None = None):
+    """Write the index snapshot along with modification times of the files it was built from."""
+    snapshot = {
+        "version": INDEX_VERSION,
+        "python": sys.version_info[:2],     # marshal format is specific to the Python version
+        "mtimes": mtimes or _source_mtimes(),
+        "index": index._asdict(),
+    }
+    tmp_filepath = f"{INDEX_FILE}.{os.getpid()}.tmp"
+    with open(tmp_filepath, "wb") as f:
+        marshal.dump(snapshot, f)
+    os.replace(tmp_filepath, INDEX_FILE)
+
+
+def _load_snapshot(mtimes: dict[str, int]) -> DataIndex | None:
+    """Return the index snapshot if it's still valid, `None` otherwise."""
+    try:
+        with open(INDEX_FILE, "rb") as f:
+            snapshot = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if snapshot.get("version") != INDEX_VERSION or tuple(snapshot.get("python", ())) != sys.version_info[:2] \
+            or snapshot.get("mtimes") != mtimes:
+        return None
+    return DataIndex(**snapshot["index"])
+
+
+@lru_cache
+def get_index() -> DataIndex:
+    """Return the data index (loaded once per process).
+
+    The snapshot is used if it's up to date, otherwise the index is rebuilt from the JSON files and saved.
+    """
+    mtimes = _source_mtimes()
+    if (index := _load_snapshot(mtimes)) is not None:
+        return index
+
+    index = build_index()
+    try:
+        save_index(index, mtimes)
+    except OSError:     # read-only installation, just use the index without saving it
+        pass
+    return index
@@ -6,22 +6,38 @@ If you already have `data` directory with all required data, you don't need to r
      * `all_competitions.json`: All competitions
      * `competitions.json`: Available competitions within your permissions
      * `teams.json`: Available teams within your permissions
+     * `fingerprints.json`: Season, last update and teams of each available competition (used by `--incremental`)
+     * `index.bin`: Precompiled lookup index of teams and competitions (rebuilt automatically if outdated)
 
 `data` directory may also contain an optional file called `options.json` which define choices of CLI options of type `click.Choice`.
 """
 
-import time
+import os
+import hashlib
+import rich_click as click
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict, field
+from typing import Any, Iterator
+from dotenv import load_dotenv
 from request_handler import RequestHandler
-from models import CompetitionTeams, update_forward_refs
+from models import CompetitionTeams
 from utils import load_json, save_json
+from data_index import build_index, save_index
+
+
+load_dotenv()
 
 
 # Available competitions within the free-tier permissions
 AVAILABLE_COMPETITION_CODES = load_json("options.json").get("competition_codes") \
      or ["WC", "CL", "BL1", "DED", "BSA", "PD", "FL1", "ELC", "PPL", "EC", "SA", "PL", "CLI"]
 
+# Maximum number of concurrent requests (the actual throughput is bound by the API quota through the rate limiter)
+MAX_WORKERS = int(os.getenv("FOOTBALL_CLI_GEN_WORKERS", "8"))
+
+FINGERPRINTS_FILE = "fingerprints.json"
+
 
 @dataclass
 class Zone:
@@ -42,21 +58,37 @@ class CompetitionProperties:
     position_colors: dict[str, str] = field(default_factory=dict)
 
 
-def prepare_competitions_data():
+def fetch_concurrently(paths: list[str], max_workers: int = MAX_WORKERS) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Send requests concurrently and yield responses as soon as they arrive.
+
+    :param paths: request paths
+    :param max_workers: maximum number of requests in flight
+
+    :return: iterator of (path, response) pairs in completion order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(RequestHandler(path=path, show_status=False).send_request): path
+            for path in paths
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def prepare_competitions_data(all_competitions: dict[str, Any]) -> dict[str, dict]:
     """Prepare available competitions data.
     
     The main purpose is to add `zones` attribute which represents different zones in the standings table
     and hence, colorize the table (when requested) based on these zones.
-    """
-    d = load_json("all_competitions.json")
-    if not d:
-        d = RequestHandler(
-            path=f"competitions"
-        ).send_request()
-        save_json(d, "all_competitions.json")    
 
+    :param all_competitions: response of `competitions` endpoint
+    """
     competitions: dict[str, CompetitionProperties] = {}
-    for competition in d["competitions"]:
+    for competition in all_competitions["competitions"]:
         code = competition["code"]
         if code not in AVAILABLE_COMPETITION_CODES:
             continue
@@ -159,40 +191,174 @@ def prepare_competitions_data():
             for i in range(zone.start_position, zone.end_position + 1):
                 competition.position_colors[str(i)] = color
 
-    competitions_to_dump = {key: asdict(val)
-                            for key, val in competitions.items()}
-    
-    save_json(competitions_to_dump, "competitions.json")
+    return {key: asdict(val) for key, val in competitions.items()}
 
 
-def prepare_teams_data():
+def prepare_teams_data(competition_teams: dict[str, CompetitionTeams]) -> dict[str, dict]:
     """Prepare available teams data (id, name, country).
     
     These data will be shown to the user when requested to get the ID of a specific team.
+
+    :param competition_teams: teams of each available competition (by competition code)
     """
-    update_forward_refs()
     d = defaultdict(dict)
-    for i, code in enumerate(AVAILABLE_COMPETITION_CODES):
-        print(f"Requesting {code} teams...")
-        time.sleep(7)    # in order not to exceed max requests per minute (10)
-        result = RequestHandler(
-            path=f"competitions/{code}/teams"
-        ).send_request()
-        teams = CompetitionTeams(**result).teams
-        for team in teams:
-            d[team.tla][team.id] = {
+    for code in AVAILABLE_COMPETITION_CODES:    # keep the same order regardless of which response arrived first
+        if code not in competition_teams:
+            continue
+        for team in competition_teams[code].teams:
+            d[team.tla][str(team.id)] = {
                 "full_name": team.fullName,
                 "short_name": team.shortName,
                 "country": getattr(team.area, "name", None)
             }
 
-    save_json(d, "teams.json")
+    return d
+
+
+def prepare_fingerprints(
+    all_competitions: dict[str, Any], competition_teams: dict[str, CompetitionTeams]
+) -> dict[str, dict]:
+    """Return fingerprints of the available competitions used to detect changes in later runs.
+
+    :param all_competitions: response of `competitions` endpoint
+    :param competition_teams: teams of each available competition (by competition code)
+    """
+    fingerprints = {}
+    for competition in all_competitions["competitions"]:
+        code = competition["code"]
+        if code not in competition_teams:
+            continue
+        team_ids = sorted(team.id for team in competition_teams[code].teams)
+        fingerprints[code] = {
+            "season_id": (competition.get("currentSeason") or {}).get("id"),
+            "last_updated": competition.get("lastUpdated"),
+            "teams_hash": hashlib.sha1(",".join(map(str, team_ids)).encode()).hexdigest(),
+            "team_ids": team_ids,
+        }
+    return fingerprints
+
+
+def is_outdated(competition: dict[str, Any], fingerprint: dict[str, Any] | None) -> bool:
+    """Check whether a competition changed (new season or updated) since its fingerprint was taken."""
+    if not fingerprint:
+        return True
+    season_id = (competition.get("currentSeason") or {}).get("id")
+    return season_id != fingerprint["season_id"] or competition.get("lastUpdated") != fingerprint["last_updated"]
+
+
+def merge_teams_data(
+    teams: dict[str, dict], new_teams: dict[str, dict], removed_ids: set[str]
+) -> dict[str, dict]:
+    """Merge teams of updated competitions into existing teams data.
+
+    :param teams: existing teams data
+    :param new_teams: teams data of updated competitions
+    :param removed_ids: IDs of teams that are no longer in any available competition
+    """
+    merged = defaultdict(dict)
+    for tla, teams_dict in teams.items():
+        for id_, team in teams_dict.items():
+            if id_ not in removed_ids:
+                merged[tla][id_] = team
+    for tla, teams_dict in new_teams.items():
+        merged[tla].update(teams_dict)
+
+    return merged
+
+
+def fetch_teams(codes: list[str], workers: int, all_competitions: dict[str, Any] = {}) -> tuple[dict[str, CompetitionTeams], dict[str, Any]]:
+    """Fetch teams of competitions concurrently (as well as all competitions if not provided).
+
+    :return: teams of each competition (by competition code) and all competitions
+    """
+    paths = [f"competitions/{code}/teams" for code in codes]
+    if not all_competitions:
+        paths.append("competitions")
+
+    competition_teams: dict[str, CompetitionTeams] = {}
+    for path, result in fetch_concurrently(paths, max_workers=workers):
+        if path == "competitions":
+            all_competitions = result
+            continue
+        code = path.split("/")[1]
+        competition_teams[code] = CompetitionTeams(**result)     # validate as soon as the response arrives
+        print(f"Received {code} teams ({len(competition_teams)}/{len(codes)})")
+
+    return competition_teams, all_competitions
+
+
+def regenerate(workers: int):
+    """Generate all data from scratch."""
+    print("Preparing data.....\nThis might take around one minute on the free tier, so please wait.")
+    competition_teams, all_competitions = fetch_teams(
+        AVAILABLE_COMPETITION_CODES, workers, all_competitions=load_json("all_competitions.json")
+    )
+
+    save_json(all_competitions, "all_competitions.json")
+    save_json(prepare_teams_data(competition_teams), "teams.json")
+    save_json(prepare_competitions_data(all_competitions), "competitions.json")
+    save_json(prepare_fingerprints(all_competitions, competition_teams), FINGERPRINTS_FILE)
+    save_index(build_index())
+
+
+def regenerate_incrementally(workers: int):
+    """Only refetch teams of competitions that changed since the last run and merge them into existing data."""
+    print("Checking for updated competitions.....")
+    all_competitions = RequestHandler(path="competitions").send_request()
+    fingerprints = load_json(FINGERPRINTS_FILE)
+    teams = load_json("teams.json")
+    competitions = load_json("competitions.json")
+
+    outdated_codes = [
+        competition["code"] for competition in all_competitions["competitions"]
+        if competition["code"] in AVAILABLE_COMPETITION_CODES
+        and (not teams or competition["code"] not in competitions
+             or is_outdated(competition, fingerprints.get(competition["code"])))
+    ]
+    if not outdated_codes:
+        print("Data is already up to date.")
+        return
+
+    print(f"Updating {', '.join(outdated_codes)}.....")
+    competition_teams, _ = fetch_teams(outdated_codes, workers, all_competitions=all_competitions)
+
+    new_fingerprints = prepare_fingerprints(all_competitions, competition_teams)
+    changed_codes = [
+        code for code in outdated_codes
+        if new_fingerprints[code]["teams_hash"] != fingerprints.get(code, {}).get("teams_hash")
+    ]
+    if changed_codes:
+        kept_ids = {
+            str(id_) for code, fingerprint in fingerprints.items()
+            if code not in changed_codes for id_ in fingerprint["team_ids"]
+        }
+        removed_ids = {
+            str(id_) for code in changed_codes for id_ in fingerprints.get(code, {}).get("team_ids", [])
+        } - kept_ids
+        changed_teams = prepare_teams_data({code: competition_teams[code] for code in changed_codes})
+        save_json(merge_teams_data(teams, changed_teams, removed_ids), "teams.json")
+
+    all_competitions_data = prepare_competitions_data(all_competitions)
+    competitions.update({code: all_competitions_data[code] for code in outdated_codes})
+    save_json(competitions, "competitions.json")
+
+    fingerprints.update(new_fingerprints)
+    save_json(fingerprints, FINGERPRINTS_FILE)
+    save_index(build_index())
+    print(f"Teams changed in: {', '.join(changed_codes) or 'none'}")
 
 
-def main():
-    print("Preparing data.....\nThis might take around one minute, so please wait.")
-    prepare_teams_data()
-    prepare_competitions_data()
+@click.command()
+@click.option("--workers", type=click.IntRange(min=1), default=MAX_WORKERS, show_default=True,
+              help="Maximum number of concurrent requests.")
+@click.option("--incremental", is_flag=True,
+              help="Only refetch competitions whose season or teams changed since the last run.")
+def main(workers, incremental):
+    """Generate data directory (available competitions and teams)."""
+    if incremental:
+        regenerate_incrementally(workers)
+    else:
+        regenerate(workers)
 
 
 if __name__ == "__main__":
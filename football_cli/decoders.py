@@ -0,0 +1,190 @@
+"""Fast-path decoding of trusted API responses into models.
+
+Full `pydantic` validation checks and coerces every field of every nested object, which dominates CPU time
+for large responses (e.g. season-long match sets). Responses coming from our own cache were already received
+from the API, so they're decoded by functions compiled (once per model) from the model fields instead:
+nested models are built without validation, and root validators still run to produce the same derived fields.
+
+Entities repeated throughout a response (e.g. the teams, competition and season of every match) are decoded once
+per response and shared (models are immutable), keyed on their id and raw object (a compact reference to a team and
+its full object are decoded separately), as are string values (e.g. match status, stage and date), so that
+memory and decoding time grow with the number of distinct entities rather than the size of the response.
+Validated responses share entities the same way (see `BaseModel.validate`), each of them is validated once.
+"""
+
+from __future__ import annotations
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Iterator, Union, get_args, get_origin
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+from pydantic.main import BaseModel
+
+Decoder = Callable[[dict[str, Any]], BaseModel]
+
+INTERNED_MODELS = ["Team", "Competition", "Season"]     # models decoded once per id (in a response)
+
+_decoders: dict[type[BaseModel], Decoder] = {}
+_local = threading.local()      # instances of interned models (decoded in the current thread)
+
+Variants = list[tuple[dict[str, Any], BaseModel]]     # instances of an interned model with the same id, by raw object
+
+
+@contextmanager
+def interning() -> Iterator[None]:
+    """Share instances of interned models decoded from identical objects within the block (nested blocks share them too)."""
+    if getattr(_local, "instances", None) is not None:
+        yield
+        return
+
+    _local.instances = {}
+    try:
+        yield
+    finally:
+        _local.instances = None
+
+
+def is_interned(model: type[BaseModel]) -> bool:
+    """Check whether instances of a model are shared (only immutable models with an id are)."""
+    return model.__name__ in INTERNED_MODELS and "id" in model.__fields__ and not model.__config__.allow_mutation
+
+
+def variants(model: type[BaseModel], key: Any) -> Variants:
+    """Return instances of a model with an id, along with the raw objects they were decoded from.
+
+    Outside of `interning` blocks, instances are never shared.
+    """
+    if (instances := getattr(_local, "instances", None)) is None:
+        return []
+    return instances.setdefault(model, {}).setdefault(key, [])
+
+
+def find(variants_: Variants, data: dict[str, Any]) -> BaseModel | None:
+    """Return the instance decoded from an object identical to the raw one (`None` if there's none)."""
+    for raw, instance in variants_:
+        if raw == data:
+            return instance
+    return None
+
+
+def _parse_datetime(value: Any) -> datetime:
+    if isinstance(value, str) and value.endswith("Z"):
+        return datetime.fromisoformat(f"{value[:-1]}+00:00")    # much faster than pydantic's parser for the API format
+    return parse_datetime(value)
+
+
+def field_converter(field) -> Callable[[Any], Any] | None:
+    """Return the function converting the raw value of a field (`None` if the raw value is used as is)."""
+    type_ = field.type_
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        decode = get_decoder(type_)
+        if field.shape == SHAPE_LIST:
+            return lambda values: [decode(value) for value in values]
+        if field.shape == SHAPE_SINGLETON:
+            return decode
+    elif get_origin(type_) is Union or type(type_).__name__ == "UnionType":
+        models = [arg for arg in get_args(type_) if isinstance(arg, type) and issubclass(arg, BaseModel)]
+        if models:      # e.g. `Season | str`, the model is decoded from objects only
+            decode = get_decoder(models[0])
+            return lambda value: decode(value) if isinstance(value, dict) else value
+    elif type_ is datetime:
+        return _parse_datetime
+    if field.shape != SHAPE_SINGLETON:
+        raise TypeError(f"Unsupported field {field.name!r}")
+    return None
+
+
+def _compile(model: type[BaseModel]) -> Decoder:
+    """Generate (and compile) the source of a decoder specialized for a model's fields and root validators.
+
+    For example, the decoder of `Season` looks like:
+        def decode(data):
+            get = data.get
+            if (key := get("id")) is not None:
+                shared = variants(model, key)
+                if (instance := find(shared, data)) is not None:
+                    return instance
+            values = {
+                "id": data["id"],
+                "winner": None if (value := get("winner")) is None else convert_winner(value),
+                ...
+            }
+            values = validator_0(model, values)
+            if (value := values["startDate"]).__class__ is str:
+                values["startDate"] = intern(value)
+            ...
+            instance = new(model)
+            ...
+    """
+    _decoders[model] = lambda data: get_decoder(model)(data)    # recursive models are resolved lazily
+
+    namespace = {"model": model, "new": object.__new__, "set_attribute": object.__setattr__,
+                 "field_names": frozenset(model.__fields__), "variants": variants, "find": find, "intern": sys.intern}
+    is_shared = is_interned(model)
+    items = []
+    for name, field in model.__fields__.items():
+        if (convert := field_converter(field)) is not None:
+            namespace[f"convert_{name}"] = convert
+        if field.required:
+            value = f"(value := data[{name!r}])"
+        else:
+            namespace[f"default_{name}"] = field.default
+            copy = ".copy()" if isinstance(field.default, (list, dict)) else ""
+            value = f"(value := get({name!r}, default_{name}{copy}))" if copy or field.default is not None \
+                else f"(value := get({name!r}))"
+        if convert is not None:
+            value = f"None if {value} is None else convert_{name}(value)"
+        items.append(f"        {name!r}: {value},")
+
+    lines = ["def decode(data):", "    get = data.get"]
+    if is_shared:
+        lines += [
+            "    if (key := get('id')) is not None:",
+            "        shared = variants(model, key)",
+            "        if (instance := find(shared, data)) is not None:",
+            "            return instance",
+        ]
+    lines += ["    values = {", *items, "    }"]
+    for i, (_, validator) in enumerate(model.__post_root_validators__):
+        namespace[f"validator_{i}"] = validator
+        lines.append(f"    values = validator_{i}(model, values)")
+    for name, field in model.__fields__.items():     # after root validators, to intern derived values too
+        if str in (get_args(field.type_) or (field.type_,)):
+            lines += [
+                f"    if (value := values[{name!r}]).__class__ is str:",
+                f"        values[{name!r}] = intern(value)",
+            ]
+    lines += [
+        "    instance = new(model)",
+        "    set_attribute(instance, '__dict__', values)",
+        "    set_attribute(instance, '__fields_set__', data.keys() & field_names)",
+    ]
+    if is_shared:
+        lines += [
+            "    if key is not None:",
+            "        shared.append((data, instance))",
+        ]
+    lines.append("    return instance")
+    exec(compile("\n".join(lines), f"<decoder of {model.__name__}>", "exec"), namespace)
+
+    _decoders[model] = decode = namespace["decode"]
+    return decode
+
+
+def get_decoder(model: type[BaseModel]) -> Decoder:
+    """Return the decoder of a model (compiled on first use)."""
+    try:
+        return _decoders[model]
+    except KeyError:
+        return _compile(model)
+
+
+def decode(model: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """Decode a trusted response into a model without validating it.
+
+    :raise KeyError, TypeError, ValueError, AttributeError: if the response doesn't match the model
+    """
+    with interning():
+        return get_decoder(model)(data)
@@ -1,11 +1,14 @@
 import os
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-from pydantic import ValidationError
 from rich_click import ClickException
 from rich.console import Console
-from requests.exceptions import RequestException
 from utils import no_result
 
+if TYPE_CHECKING:   # pydantic and requests are only imported when needed
+    from pydantic import ValidationError
+    from requests.exceptions import RequestException
+
 
 load_dotenv()
 SHOW_ERROR_DETAILS = os.getenv("SHOW_ERROR_DETAILS") == "1"
@@ -26,7 +29,7 @@ def formatting_error_handler(f):
 
 
 class APIResponseParsingError(ClickException):
-    def __init__(self, error: ValidationError):
+    def __init__(self, error: "ValidationError"):
         message = "Error while parsing API response."
         if SHOW_ERROR_DETAILS:
             message += f"\n\n{error}"
@@ -35,30 +38,36 @@ class APIResponseParsingError(ClickException):
 
 class APIRequestException(ClickException):
     def __init__(self, error_type="", status_code="", error_details=""):
+        self.status_code = status_code
         message = f"{error_type} {status_code}"
         if SHOW_ERROR_DETAILS and error_details:
             message += f"\n{error_details}"
         super().__init__(message)
 
 
+def _response_details(error: "RequestException") -> tuple:
+    """Return the status code and error message of the response to a failed request (empty if there's none)."""
+    if (response := error.response) is None:     # e.g. timeout
+        return "", str(error)
+    try:
+        message = response.json().get("message", "")
+    except (ValueError, AttributeError):    # e.g. HTML error page of a proxy
+        message = ""
+    return response.status_code, message
+
+
 class ConnectionError(APIRequestException):
     def __init__(self):
         super().__init__(error_type="Connection Error")
 
 
 class HTTPError(APIRequestException):
-    def __init__(self, error: RequestException):
-        super().__init__(
-            error_type="HTTP Error",
-            status_code=error.response.status_code,
-            error_details=error.response.json().get("message", "")
-        )
+    def __init__(self, error: "RequestException"):
+        status_code, message = _response_details(error)
+        super().__init__(error_type="HTTP Error", status_code=status_code, error_details=message)
 
 
 class RequestError(APIRequestException):
-    def __init__(self, error: RequestException):
-        super().__init__(
-            error_type="Request Error",
-            status_code=error.response.status_code,
-            error_details=error.response.json().get("message", "")
-        )
+    def __init__(self, error: "RequestException"):
+        status_code, message = _response_details(error)
+        super().__init__(error_type="Request Error", status_code=status_code, error_details=message)
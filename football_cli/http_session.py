@@ -0,0 +1,123 @@
+import os
+import time
+import threading
+import requests
+from dataclasses import dataclass
+from typing import Any, Optional
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+load_dotenv()
+POOL_CONNECTIONS = int(os.getenv("FOOTBALL_CLI_POOL_CONNECTIONS", "4"))     # number of hosts to keep pools for
+POOL_MAXSIZE = int(os.getenv("FOOTBALL_CLI_POOL_MAXSIZE", "16"))            # number of connections kept alive per host
+TIMEOUT = float(os.getenv("FOOTBALL_CLI_REQUEST_TIMEOUT", "30"))    # seconds to connect, and between bytes received
+
+_local = threading.local()      # timing of the request being sent by the current thread
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+@dataclass
+class RequestTiming:
+    """Time spent (in seconds) in each phase of a request.
+
+    `connect` and `tls` are zero if an already open connection was reused.
+    """
+    connect: float = 0.0
+    tls: float = 0.0
+    ttfb: float = 0.0       # from sending the request until the response headers arrive
+    download: float = 0.0   # reading the response body
+    size: int = 0           # response body size in bytes (after decompression)
+
+    @property
+    def total(self) -> float:
+        return self.connect + self.tls + self.ttfb + self.download
+
+    def __str__(self) -> str:
+        phases = {"connect": self.connect, "tls": self.tls, "ttfb": self.ttfb, "download": self.download, "total": self.total}
+        return " | ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in phases.items()) + f" | {self.size} bytes"
+
+
+class _TimedConnectionMixin:
+    """Record TCP connection time of new connections in the timing of the current request."""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        if timing := getattr(_local, "timing", None):
+            timing.connect += time.perf_counter() - start
+        return sock
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        timing = getattr(_local, "timing", None)
+        connect_before = timing.connect if timing else 0.0
+        start = time.perf_counter()
+        super().connect()
+        if timing:      # TLS handshake is whatever remains after the TCP connection
+            timing.tls += time.perf_counter() - start - (timing.connect - connect_before)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Connection pool adapter attaching a `RequestTiming` to each response (as `response.timing`)."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        timing = RequestTiming()
+        _local.timing = timing
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        finally:
+            _local.timing = None
+        timing.ttfb = time.perf_counter() - start - timing.connect - timing.tls
+        response.timing = timing
+        return response
+
+
+def get_session() -> requests.Session:
+    """Return the HTTP session shared by all requests in the process (created on first use)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = TimedHTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+            _session = session
+    return _session
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """Send a GET request through the shared session and read the response body.
+
+    The returned response has a `timing` attribute (`RequestTiming`) with the time spent in each phase of the request.
+
+    :raise requests.Timeout: if the server doesn't respond within `TIMEOUT` (unless another timeout is passed)
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    response = get_session().get(url, stream=True, **kwargs)
+    start = time.perf_counter()
+    response.timing.size = len(response.content)
+    response.timing.download = time.perf_counter() - start
+    return response
@@ -0,0 +1,35 @@
+"""Entry point of the `football` command.
+
+This module is kept lightweight on purpose: it only imports the CLI (and everything it needs) when it can't
+handle the invocation on its own, i.e. unless it's a shell completion request that can be served from the data directory,
+or a command that can be forwarded to the daemon (`football serve`). Watch mode (`--watch`) always runs in the client
+process, since it runs until interrupted and would otherwise keep the daemon busy.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+
+def main():
+    prog_name = os.path.basename(sys.argv[0]) or "football"
+    complete_var = f"_{prog_name}_COMPLETE".replace("-", "_").upper()    # same as click
+    if os.environ.get(complete_var):
+        from completion import complete
+
+        if complete(complete_var):
+            sys.exit(0)
+    elif "serve" not in sys.argv[1:] and "--watch" not in sys.argv[1:]:    # the daemon runs one command at a time
+        from daemon import forward
+
+        if (exit_code := forward(sys.argv[1:])) is not None:     # run by the daemon (if running)
+            sys.exit(exit_code)
+
+    from main import cli
+
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import importlib
+import rich_click as click
+
+
+class LazyGroup(click.RichGroup):
+    """`click` group whose subcommands are only imported when they are used.
+
+    :param lazy_subcommands: mapping of command names to their import paths (`<module>.<command object>`)
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] = {}, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, command_name = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        command = getattr(importlib.import_module(module_name), command_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy loading of {self.lazy_subcommands[cmd_name]!r} failed: not a click command")
+        self.add_command(command, cmd_name)     # cache the loaded command
+        self.lazy_subcommands = {name: path for name, path in self.lazy_subcommands.items() if name != cmd_name}
+        return command
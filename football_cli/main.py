@@ -1,28 +1,80 @@
 import os
+import sys
+import time
 import rich_click as click
+from functools import partial
 from dotenv import load_dotenv
-from models import update_forward_refs
-from commands.competition import competition
-from commands.team import team
-from commands.matches import matches
-from request_handler import RequestHandler
+from lazy_group import LazyGroup
+from output_records import FORMATS
 
 
 load_dotenv()
 
 
-@click.group()
+# Commands are only imported when invoked, so that `--help` and shell completion don't pay for loading everything
+COMMANDS = {
+    "competition": "commands.competition.competition",
+    "team": "commands.team.team",
+    "matches": "commands.matches.matches",
+    "serve": "commands.serve.serve",
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS)
 @click.option("--api-key", envvar="FOOTBALL_CLI_API_KEY", required=True,
               help="""Can be provided through an environment variable called FOOTBALL_CLI_API_KEY.\n
               Get it from https://www.football-data.org/client/register.""")
-def cli(api_key):
-    update_forward_refs()
+@click.option("--output", "output_format", type=click.Choice(FORMATS),
+              help="Write matches, standings, scorers or teams in a machine-readable format instead of rendering them.")
+@click.option("--plain", is_flag=True,
+              help="Render output as plain aligned text (much faster for long lists of matches, squads and teams).")
+@click.option("--stream", is_flag=True,
+              help="Print long lists of matches group by group (e.g. day by day) as soon as each group is ready.")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Number of processes rendering long lists of matches (top-level groups are rendered in parallel).")
+@click.option("--profile", is_flag=True, help="Show how long each stage of the command took (network, validation, rendering, ...).")
+@click.option("--profile-trace", type=click.Path(dir_okay=False),
+              help="Save profiling spans to a Chrome trace file (implies --profile).")
+@click.pass_context
+def cli(ctx, api_key, output_format, plain, stream, jobs, profile, profile_trace):
+    from request_handler import RequestHandler
+
     os.environ["FOOTBALL_CLI_API_KEY"] = api_key
     RequestHandler.API_KEY = api_key
 
+    import metrics
+
+    if metrics.ENABLED:
+        ctx.call_on_close(partial(_record_command, ctx, time.perf_counter()))
+
+    if profile or profile_trace:
+        import profiling
+
+        profiling.enable()
+        ctx.call_on_close(lambda: _report_profile(profile_trace))
+
+
+def _record_command(ctx: click.Context, started_at: float):
+    """Record the command in metrics (called when the command is done, even if it failed)."""
+    import metrics
+
+    error = sys.exc_info()[1]
+    ok = error is None or isinstance(error, click.exceptions.Exit) and error.exit_code == 0
+    metrics.record_command(ctx.invoked_subcommand or "", time.perf_counter() - started_at, "ok" if ok else "error")
+    metrics.flush()
+
+
+def _report_profile(trace_filepath: str | None):
+    """Print profiling summary (to stderr) and save the trace file if requested."""
+    import profiling
+    from rich.console import Console
 
-for cmd in [competition, team, matches]:
-    cli.add_command(cmd)
+    profiling.disable()
+    console = Console(stderr=True)
+    console.print(profiling.summary_table())
+    if trace_filepath:
+        profiling.write_chrome_trace(trace_filepath)
+        console.print(f"[dim]Trace saved to {trace_filepath}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,171 @@
+"""Usage metrics exported to a Prometheus textfile (for node-exporter's textfile collector).
+
+Set `FOOTBALL_CLI_METRICS_FILE` (e.g. `/var/lib/node_exporter/textfile_collector/football_cli.prom`) to enable them.
+Metrics are cumulative across runs: each process merges what it recorded into `data/metrics.json`
+(guarded by a lock file) before rewriting the textfile.
+"""
+
+import os
+import re
+import json
+import atexit
+import threading
+from typing import Optional
+from dotenv import load_dotenv
+from utils import DATA_DIR, file_lock
+
+
+load_dotenv()
+METRICS_FILE = os.getenv("FOOTBALL_CLI_METRICS_FILE")
+ENABLED = bool(METRICS_FILE)
+STATE_FILE = os.path.join(DATA_DIR, "metrics.json")
+LOCK_FILE = "metrics.lock"
+PREFIX = "football_cli"
+
+# name: (type, help, histogram buckets)
+METRICS = {
+    "requests_total": ("counter", "API responses received, by endpoint and status code.", None),
+    "response_bytes": ("histogram", "Size of API responses (after decompression).",
+                       [1024, 4096, 16384, 65536, 262144, 1048576, 4194304]),
+    "request_duration_seconds": ("histogram", "Time taken by API requests (connect to end of download).",
+                                 [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]),
+    "cache_requests_total": ("counter", "Response cache lookups, by endpoint and result (hit or miss).", None),
+    "rate_limit_waits_total": ("counter", "Requests delayed by the rate limiter.", None),
+    "rate_limit_wait_seconds_total": ("counter", "Time spent waiting for the API request quota to be reset.", None),
+    "commands_total": ("counter", "Commands run, by command and exit status.", None),
+    "command_duration_seconds": ("histogram", "Time taken by commands (excluding interpreter startup).",
+                                 [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]),
+}
+
+_ID_SEGMENT = re.compile(r"(?<=^competitions/)[^/]+|(?<=^teams/)[^/]+|(?<=^matches/)[^/]+|(?<=^persons/)[^/]+")
+
+_pending: dict[str, dict[str, list[float] | float]] = {}    # metric name -> labels key -> value (recorded since last flush)
+_lock = threading.Lock()
+
+
+def endpoint(path: str) -> str:
+    """Return the endpoint of a request path, with IDs replaced by a placeholder (e.g. `competitions/{id}/matches`)."""
+    return _ID_SEGMENT.sub("{id}", path, count=1)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels_key(labels: dict[str, str]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in sorted(labels.items()))
+
+
+def inc(name: str, value: float = 1, **labels: str):
+    """Increment a counter."""
+    if not ENABLED:
+        return
+    key = _labels_key(labels)
+    with _lock:
+        values = _pending.setdefault(name, {})
+        values[key] = values.get(key, 0) + value
+
+
+def observe(name: str, value: float, **labels: str):
+    """Add an observation to a histogram."""
+    if not ENABLED:
+        return
+    buckets = METRICS[name][2]
+    key = _labels_key(labels)
+    with _lock:
+        values = _pending.setdefault(name, {})
+        histogram = values.setdefault(key, [0] * (len(buckets) + 2))     # bucket counts, sum, count
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                histogram[i] += 1
+        histogram[-2] += value
+        histogram[-1] += 1
+
+
+def record_request(path: str, status: int | str, size: Optional[int] = None, duration: Optional[float] = None):
+    """Record an API response (or a failed request, using `error` status)."""
+    endpoint_ = endpoint(path)
+    inc("requests_total", endpoint=endpoint_, status=str(status))
+    if size is not None:
+        observe("response_bytes", size, endpoint=endpoint_)
+    if duration is not None:
+        observe("request_duration_seconds", duration, endpoint=endpoint_)
+
+
+def record_cache(path: str, hit: bool):
+    inc("cache_requests_total", endpoint=endpoint(path), result="hit" if hit else "miss")
+
+
+def record_rate_limit_wait(seconds: float):
+    inc("rate_limit_waits_total")
+    inc("rate_limit_wait_seconds_total", seconds)
+
+
+def record_command(command: str, duration: float, status: str = "ok"):
+    inc("commands_total", command=command, status=status)
+    observe("command_duration_seconds", duration, command=command)
+
+
+def _merge(state: dict[str, dict], pending: dict[str, dict]):
+    for name, values in pending.items():
+        merged = state.setdefault(name, {})
+        for key, value in values.items():
+            if isinstance(value, list):
+                merged[key] = [a + b for a, b in zip(merged.get(key, [0] * len(value)), value)]
+            else:
+                merged[key] = merged.get(key, 0) + value
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def format_textfile(state: dict[str, dict]) -> str:
+    """Format metrics in the Prometheus text exposition format."""
+    lines = []
+    for name, (type_, help_, buckets) in METRICS.items():
+        if not (values := state.get(name)):
+            continue
+        full_name = f"{PREFIX}_{name}"
+        lines += [f"# HELP {full_name} {help_}", f"# TYPE {full_name} {type_}"]
+        for key, value in sorted(values.items()):
+            if type_ == "counter":
+                lines.append(f"{full_name}{{{key}}} {_format_value(value)}" if key else f"{full_name} {_format_value(value)}")
+                continue
+            separator = "," if key else ""
+            for bound, count in zip([*buckets, "+Inf"], [*value[:len(buckets)], value[-1]]):
+                lines.append(f'{full_name}_bucket{{{key}{separator}le="{bound}"}} {_format_value(count)}')
+            labels = f"{{{key}}}" if key else ""
+            lines.append(f"{full_name}_sum{labels} {_format_value(value[-2])}")
+            lines.append(f"{full_name}_count{labels} {_format_value(value[-1])}")
+    return "\n".join(lines) + "\n"
+
+
+def flush():
+    """Merge metrics recorded by this process into the shared state and rewrite the textfile."""
+    if not ENABLED:
+        return
+    with _lock:
+        pending = {name: dict(values) for name, values in _pending.items()}
+        _pending.clear()
+    if not pending:
+        return
+
+    with file_lock(LOCK_FILE):
+        try:
+            with open(STATE_FILE, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        _merge(state, pending)
+        with open(STATE_FILE, "w") as f:
+            json.dump(state, f)
+
+        tmp_filepath = f"{METRICS_FILE}.{os.getpid()}.tmp"    # the collector must never read a partial file
+        with open(tmp_filepath, "w") as f:
+            f.write(format_textfile(state))
+        os.replace(tmp_filepath, METRICS_FILE)
+
+
+if ENABLED:
+    atexit.register(flush)
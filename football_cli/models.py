@@ -1,14 +1,56 @@
 from __future__ import annotations
 import pydantic
 from pydantic import BaseModel as PydanticBaseModel, root_validator
-from typing import Optional
+from typing import Any, Optional, TYPE_CHECKING
 from datetime import datetime
+import decoders
+import profiling
+
+if TYPE_CHECKING:
+    from projection import Projection
 
 
 class BaseModel(PydanticBaseModel):
     class Config:
         allow_mutation = False
 
+    @classmethod
+    def from_response(cls, data: dict[str, Any], trusted: bool = False, fields: Optional[Projection] = None):
+        """Parse an API response.
+
+        :param trusted: skip validation (see `decoders`), for responses that were already received (e.g. from the cache)
+        :param fields: only parse these fields (see `projection`), the whole response is parsed by default
+        """
+        with profiling.span(cls.__name__, "validation", trusted=trusted, projected=fields is not None) as args:
+            if profiling.is_enabled():
+                args["objects"] = profiling.count_objects(data)
+            if fields is not None:
+                import projection
+                with decoders.interning():
+                    return projection.parse(cls, data, fields, trusted)
+            if trusted:
+                try:
+                    return decoders.decode(cls, data)
+                except (KeyError, TypeError, ValueError, AttributeError):
+                    pass    # malformed response, validate it to report what's wrong
+            with decoders.interning():
+                return cls(**data)
+
+    @classmethod
+    def validate(cls, value: Any):
+        """Validate the value of a field of this model (pydantic calls it for nested models).
+
+        Instances of interned models (see `decoders`) are validated once per raw object and shared within
+        `interning` blocks.
+        """
+        if not isinstance(value, dict) or (key := value.get("id")) is None or not decoders.is_interned(cls):
+            return super().validate(value)
+        shared = decoders.variants(cls, key)
+        if (instance := decoders.find(shared, value)) is None:
+            instance = super().validate(value)
+            shared.append((value, instance))
+        return instance
+
 
 class Area(BaseModel):
     id: int
@@ -241,3 +283,6 @@ def update_forward_refs():
     for _, cls in globals_.items():
         if isinstance(cls, pydantic.main.ModelMetaclass):
             cls.update_forward_refs()
+
+
+update_forward_refs()     # resolve forward references once at import
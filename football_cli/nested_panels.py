@@ -1,37 +1,55 @@
-from collections import defaultdict
+from operator import itemgetter
 from rich.console import RenderableType, Group
 from rich.panel import Panel
 from rich.align import AlignMethod
-from nested_defaultdict import NestedDefaultDict
-from typing import Optional
+from typing import Any, Callable, Optional, Sequence
 
 
 class NestedPanels:
-    """Handle nested panels construction using `NestedDefaultDict`."""
+    """Handle nested panels construction from groups identified by a sequence of keys (one per nesting level).
+
+    Groups are kept in a flat dictionary (by their composite key) while they're filled,
+    and only nested once when panels are constructed.
+    """
 
     PANEL_COLORS = ["cyan", "yellow", "green"]
 
     def __init__(self):
-        self.panels = NestedDefaultDict()
-
-    def get(self, keys: list, default: RenderableType) -> RenderableType:
-        """If all (sub-)keys are in the nested panels dictionary, return the value. Otherwise insert `default` value and return it."""
-        return self.panels.setdefault(keys, default)
-
-    def sort_panels(self, dict_: defaultdict, keywords: tuple[str] = ("matchday", "group")) -> list[tuple]:
+        self.groups: dict[tuple, RenderableType] = {}
+
+    def get(self, keys: Sequence, factory: Callable[[], RenderableType]) -> RenderableType:
+        """Return the value of a group if it exists. Otherwise insert the value returned by `factory` and return it."""
+        keys = tuple(keys)
+        try:
+            return self.groups[keys]
+        except KeyError:
+            value = self.groups[keys] = factory()
+            return value
+
+    def nest(self) -> dict[Any, Any]:
+        """Return groups as a nested dictionary (keeping the order in which groups were inserted at every level)."""
+        panels = {}
+        for keys, value in self.groups.items():
+            dict_ = panels
+            for key in keys[:-1]:
+                dict_ = dict_.setdefault(key, {})
+            dict_[keys[-1]] = value
+        return panels
+
+    def sort_panels(self, dict_: dict, keywords: tuple[str] = ("matchday", "group")) -> list[tuple]:
         """Sort panels dictionary at some level if its keys start with some keywords."""
         items_ = list(dict_.items())
-        if None in dict_.keys():
+        if None in dict_:
             return items_
 
         key = str(items_[0][0]).lower()
         if key.startswith(keywords) and key != "group_stage":
-            items_.sort()
+            items_.sort(key=itemgetter(0))
 
         return items_
 
     def construct(
-        self, panels_dict: Optional[NestedDefaultDict | RenderableType] = None,
+        self, panels_dict: Optional[dict | RenderableType] = None,
         align: AlignMethod = "left", level=0
     ) -> tuple[RenderableType, str]:
         """Construct panels recursively from a nested dictionary.
@@ -43,9 +61,9 @@ class NestedPanels:
         :return: renderable nested panels as well as title
         """
         if panels_dict is None:     # level == 0 (root)
-            panels_dict = self.panels
+            panels_dict = self.nest()
 
-        if isinstance(panels_dict, RenderableType):     # Leaf value
+        if not isinstance(panels_dict, dict):     # Leaf value
             return panels_dict, ""
 
         panels = []
@@ -1,16 +1,57 @@
+from __future__ import annotations
+from functools import partial
+from itertools import groupby
 import rich.box as box
 from rich.columns import Columns
 from rich.align import Align
 from rich.console import Group, RenderableType
-from rich.text import Text
+from rich.style import Style
+from rich.text import Span, Text
 from rich.panel import Panel
 from rich.table import Table
 from rich_click import ClickException
-from typing import Any, Optional
-from models import Competition, Standings, Scorer, Team, Match, Score, Head2HeadAggregates
-from utils import add_rows, add_columns, no_result, load_json
+from typing import Any, Iterator, TYPE_CHECKING
+from utils import add_rows, add_columns, no_result
+from data_index import get_index
 from nested_panels import NestedPanels
+from profiling import span
 from exception_handling import formatting_error_handler
+from rows import StandingRow
+
+if TYPE_CHECKING:   # models are only used for type hints here (pydantic is imported when responses are parsed)
+    from models import Competition, Standings, Team, Head2HeadAggregates
+    from rows import MatchRow, ScorerRow
+    from projection import Projection
+
+
+# Fields of responses used by formatting functions (see `projection`), including the ones needed to derive names
+_TEAM_NAME: Projection = {"id": None, "name": None, "shortName": None, "tla": None}
+_PERSON_NAME: Projection = {"name": None, "firstName": None, "lastName": None}
+TEAMS_FIELDS: Projection = {
+    "teams": {**_TEAM_NAME, "founded": None, "venue": None, "coach": _PERSON_NAME},
+}
+TEAM_FIELDS: Projection = {
+    **_TEAM_NAME, "area": {"id": None, "name": None}, "founded": None, "venue": None, "coach": _PERSON_NAME,
+    "squad": {**_PERSON_NAME, "nationality": None, "position": None, "shirtNumber": None, "dateOfBirth": None},
+}
+H2H_FIELDS: Projection = {"aggregates": None}
+
+# Styles of match and standings cells, parsed once and shared by all cells: cells are built as `Text` spans
+# instead of markup strings, which rich would otherwise parse again for every cell of large tables
+_WHITE_DIM = Style.parse("white dim")
+_HEADER_STYLE = Style.parse("blue not bold")
+_LIVE_STYLE = Style.parse("green not bold")
+_MATCH_ROW_STYLES = {"1": Style.parse("bold"), "default": Style.parse("dim")}
+_WINNER_COLORS = {
+    "HOME_TEAM": ("green", "red"),
+    "AWAY_TEAM": ("red", "green"),
+    "DRAW": ("yellow", "yellow"),
+    None: ("white not bold", "white not bold"),
+}
+_SCORE_STYLES = {   # winner -> styles of the home team, the away team and the away goals
+    winner: (Style.parse(home), Style.parse(away), Style.parse(f"not dim {away}"))
+    for winner, (home, away) in _WINNER_COLORS.items()
+}
 
 
 @formatting_error_handler
@@ -47,8 +88,8 @@ def format_standings(standings_set: Standings) -> RenderableType:
         return no_result()
 
     competition_id = standings_set.competition.code
-    AVAILABLE_COMPETITIONS = load_json("competitions.json")
-    position_colors = AVAILABLE_COMPETITIONS[competition_id]["position_colors"]
+    index = get_index()
+    position_colors = {position: Style.parse(color) for position, color in index.position_colors(competition_id).items()}
 
     tables = []
 
@@ -75,26 +116,15 @@ def format_standings(standings_set: Standings) -> RenderableType:
         }
         add_columns(table, columns)
 
-        rows = [[
-            r.position,
-            r.team.fullName,
-            r.playedGames,
-            r.won,
-            r.draw,
-            r.lost,
-            r.goalsFor,
-            r.goalsAgainst,
-            r.goalDifference,
-            r.points
-        ] for r in standing.table]
-        add_rows(table, rows, styles=position_colors)
+        rows = [StandingRow(record).cells for record in standing.table]
+        add_rows(table, rows, styles=position_colors, formatted=True)
 
         tables.append(Align.center(table))
 
     color_codes = Table.grid()
-    for zone in AVAILABLE_COMPETITIONS[competition_id]["zones"]:
+    for zone in index.zones(competition_id):
         name, color = zone["name"], zone["color"]
-        color_codes.add_row(f"  [on {color}]  [/on {color}] {name}")
+        color_codes.add_row(Text.assemble("  ", ("  ", Style(bgcolor=color)), f" {name}"))
 
     tables.append(Align.left(color_codes))
 
@@ -199,7 +229,7 @@ def format_team(team: Team) -> RenderableType:
 
 
 @formatting_error_handler
-def format_top_scorers(scorers: list[Scorer]) -> RenderableType:
+def format_top_scorers(scorers: list[ScorerRow]) -> RenderableType:
     """Return a table with player name, goals, assists and penalties."""
     if not scorers:
         return no_result()
@@ -218,22 +248,14 @@ def format_top_scorers(scorers: list[Scorer]) -> RenderableType:
         "Penalties": {"justify": "right", "style": "red"},
         "Played": {"justify": "right", "style": "yellow"},
     })
-    add_rows(table, rows=[[
-        idx + 1,
-        scorer.player.name,
-        scorer.team.shortName,
-        scorer.goals,
-        scorer.assists,
-        scorer.penalties,
-        scorer.playedMatches,
-    ] for idx, scorer in enumerate(scorers)])
+    add_rows(table, rows=[(str(idx), *scorer.cells) for idx, scorer in enumerate(scorers, start=1)], formatted=True)
 
     return table
 
 
 @formatting_error_handler
 def format_matches(
-    matches: list[Match],
+    matches: list[MatchRow],
     group_by: list[str] = [],
     headers: list[str] = []
 ) -> RenderableType:
@@ -249,108 +271,102 @@ def format_matches(
     if not group_by:
         group_by = [None]
 
-    def _create_empty_table(headers=[]):
-        """Return an empty table which will be populated later with match scores."""
-        table = Table.grid(padding=(0, 1), expand=True)
-        columns = {
-            "Home": {"justify": "right", "min_width": 15},
-            "Score": {"justify": "center"},
-            "Away": {"justify": "left", "min_width": 15},
-            **{header: {"justify": "left", "min_width": 10} for header in headers},
-        }
-        add_columns(table, columns)
-        return table
-
     for attr in ["date", "time"]:   # move to the end for rendering purposes
         if attr in headers:
             headers.remove(attr)
             headers.append(attr)
 
-    for match in matches:
-        keys = [getattr(match, str(attr), None) for attr in group_by]
-        table = panels.get(keys, default=_create_empty_table(headers))
-        header_values = [
-            f"[blue not bold]{getattr(match, str(header), 'N/A')}" for header in headers]
-        _update_matches_table(match, table, header_values)
-
-    return panels.construct()[0]
-
-
-@formatting_error_handler
-def format_match_score(match_: Match) -> list[list[str]]:
-    """Return full time score in addition to extra time and penalties score if exist int he following order:
+    create_table = partial(_create_matches_table, headers)     # tables are only created for new groups
+    with span("group_matches", "grouping", objects=len(matches)):
+        for match in matches:
+            keys = [getattr(match, str(attr), None) for attr in group_by]
+            table = panels.get(keys, factory=create_table)
+            header_values = [
+                Text.styled(str(getattr(match, str(header), 'N/A')), _HEADER_STYLE) for header in headers]
+            _update_matches_table(match, table, header_values)
 
-    <home_team> <score> <away_team>
+    with span("construct_panels", "grouping"):
+        return panels.construct()[0]
 
-    Extra Time  <score>
 
-    Penalties   <score>
+def stream_matches(
+    matches: list[MatchRow],
+    group_by: list[str] = [],
+    headers: list[str] = []
+) -> Iterator[RenderableType]:
+    """Format a set of matches group by group, so that the output can be printed progressively (see `format_matches`).
+
+    Matches are split into runs of consecutive matches in the same top-level group (e.g. matches of the same date),
+    and each run is formatted on its own, once the previous one has been printed. Top-level groups are panels of their
+    own in the whole output too, so streaming doesn't change its structure (nested groups are part of a single panel).
+    Unless matches are sorted by their top-level group (i.e. runs of the same group are split), they're all formatted
+    at once.
     """
+    def _get_key(match: MatchRow) -> Any:
+        return getattr(match, str(group_by[0]), None) if group_by else None
 
-    def _format_score(score: Optional[Score], prefix: str = "", suffix: str = "") -> list[str]:
-        """Format a single score of a match (full time, extra time or penalties).
-
-        :param prefix: score prefix (Home team name, "Extra Time" or "Penalties")
-        :param suffix: score suffix (Away team name or "" if extra time or penalties score)
-        """
-        if not score:
-            return []
-
-        placeholder = "-"
-        separator = ":"
-        home_score = score.home if score.home is not None else placeholder
-        away_score = score.away if score.away is not None else placeholder
-        winner = match_.score.winner
-
-        match winner:
-            case "HOME_TEAM":
-                home_color, away_color = "green", "red"
-            case "AWAY_TEAM":
-                home_color, away_color = "red", "green"
-            case "DRAW":
-                home_color, away_color = "yellow", "yellow"
-            case _:
-                home_color, away_color = "white not bold", "white not bold"
-
-        return [
-            f"[{home_color}]{prefix}",
-            f"[{home_color}]{home_score}" +
-            f" [white dim]{separator}" +
-            f" [not dim {away_color}]{away_score}",
-            f"[{away_color}]{suffix}"
-        ]
+    runs = [list(run) for _, run in groupby(matches, key=_get_key)]
+    if not runs or len(runs) != len({_get_key(run[0]) for run in runs}):
+        runs = [matches]
 
-    home_team = match_.homeTeam.name
-    away_team = match_.awayTeam.name
+    for run in runs:
+        yield format_matches(run, group_by=group_by, headers=headers)
 
-    scores = [
-        _format_score(
-            match_.score.regularTime or match_.score.fullTime, home_team, away_team),
-        _format_score(match_.score.extraTime, "[white dim]Extra Time"),
-        _format_score(match_.score.penalties, "[white dim]Penalties")
-    ]
 
-    return scores
+def _create_matches_table(headers: list[str] = []) -> Table:
+    """Return an empty table which will be populated later with match scores."""
+    table = Table.grid(padding=(0, 1), expand=True)
+    columns = {
+        "Home": {"justify": "right", "min_width": 15},
+        "Score": {"justify": "center"},
+        "Away": {"justify": "left", "min_width": 15},
+        **{header: {"justify": "left", "min_width": 10} for header in headers},
+    }
+    add_columns(table, columns)
+    return table
 
 
-def _update_matches_table(match: Match, table: Table, attributes: list[Any] = []):
+def _update_matches_table(match: MatchRow, table: Table, attributes: list[Text] = []):
     """Update matches table with a match score."""
-    scores = format_match_score(match)  # [full_time, extra_time, penalties]
-    scores[0].extend(attributes)        # Add attributes beside the main score
+    full_time, *others = _format_scores(match)
+    full_time.extend(attributes)    # Add attributes beside the main score
 
     if match.is_live:
-        scores[0].append("[green not bold]live")
+        full_time.append(Text.styled("live", _LIVE_STYLE))
 
-    add_rows(table, scores, styles={
-        "1": "bold",
-        "default": "dim"
-    })
+    add_rows(table, [full_time, *others], styles=_MATCH_ROW_STYLES, formatted=True)
+
+
+def _format_scores(match: MatchRow) -> list[list[Text]]:
+    """Return full time score in addition to extra time and penalties score if exist in the following order:
+
+    <home_team> <score> <away_team>
+
+    Extra Time  <score>
+
+    Penalties   <score>
+    """
+    home_style, away_style, away_goals_style = _SCORE_STYLES.get(match.winner, _SCORE_STYLES[None])
+    scores = []
+    for label, home_goals, away_goals in match.results:
+        score = f"{home_goals} : {away_goals}"
+        end = len(score)
+        scores.append([
+            Text.styled(label, home_style + _WHITE_DIM) if label else Text.styled(str(match.home_name), home_style),
+            Text(score, spans=[
+                Span(0, end, home_style),
+                Span(len(home_goals) + 1, end, _WHITE_DIM),
+                Span(len(home_goals) + 3, end, away_goals_style),
+            ]),
+            Text.styled("" if label else str(match.away_name), away_style),
+        ])
+    return scores
 
 
 @formatting_error_handler
 def format_team_matches(
     team_id: int,
-    matches: list[Match],
+    matches: list[MatchRow],
     headers: list[str] = [],
     group_by: list[str] = []
 ) -> RenderableType:
@@ -366,7 +382,7 @@ def format_team_matches(
     return Group(Align.center(matches_details), Align.center(stats))
 
 
-def _format_team_stats(team_id: int, matches: list[Match]) -> RenderableType | None:
+def _format_team_stats(team_id: int, matches: list[MatchRow]) -> RenderableType | None:
     """Return a table with number of matches played, won, drawn, lost and scheduled."""
     def _calc_stats() -> dict[str, int]:
         stats = {
@@ -378,11 +394,11 @@ def _format_team_stats(team_id: int, matches: list[Match]) -> RenderableType | N
         }
 
         for match_ in matches:
-            home_team_id = match_.homeTeam.id
-            away_team_id = match_.awayTeam.id
+            home_team_id = match_.home_id
+            away_team_id = match_.away_id
 
             win, draw, loss, scheduled = [False] * 4
-            match match_.score.winner:
+            match match_.winner:
                 case "HOME_TEAM":
                     win = team_id == home_team_id
                     loss = not win
@@ -505,11 +521,10 @@ def format_competitions_list() -> Table:
         "Type": {"style": "red bold", "justify": "left"},
     })
 
-    AVAILABLE_COMPETITIONS = load_json("competitions.json")
     add_rows(table, rows=[
         [competition["code"], competition["name"],
             competition["area"], competition["type"]]
-        for competition in AVAILABLE_COMPETITIONS.values()
+        for competition in get_index().competitions.values()
     ])
 
     return table
@@ -531,11 +546,9 @@ def format_teams_list() -> Table:
         "Country": {"style": "red bold", "justify": "left"},
     })
 
-    AVAILABLE_TEAMS = load_json("teams.json")
     rows = [
-        [tla, team["full_name"] or "", team["short_name"] or "", team["country"]]
-        for tla, teams in AVAILABLE_TEAMS.items()
-        for team in teams.values()
+        [team["tla"], team["full_name"] or "", team["short_name"] or "", team["country"]]
+        for team in get_index().teams_by_id.values()
     ]
     rows.sort(key=lambda row: (row[3], row[2]))
     add_rows(table, rows)
@@ -0,0 +1,122 @@
+"""Machine-readable output (`football --output jsonl|csv|tsv`).
+
+Decoded models are flattened into records (one per match, standings row, scorer or team), which are written
+one at a time as JSON Lines or delimiter-separated values, without rendering anything with `rich`.
+"""
+
+from __future__ import annotations
+import csv
+import sys
+import json
+from typing import Any, Iterable, Iterator, Optional, TextIO, TYPE_CHECKING
+
+if TYPE_CHECKING:   # pydantic is imported when responses are parsed
+    from models import Match, Standings, Scorer, Team
+
+
+FORMATS = ["jsonl", "csv", "tsv"]
+DELIMITERS = {"csv": ",", "tsv": "\t"}
+
+Record = dict[str, Any]
+
+
+def match_records(matches: Iterable[Match]) -> Iterator[Record]:
+    """Yield a record per match (with its final score, extra time and penalties)."""
+    for match in matches:
+        score = match.score.regularTime or match.score.fullTime
+        yield {
+            "id": match.id,
+            "utcDate": match.utcDate.isoformat(),
+            "date": match.date,
+            "time": match.time,
+            "status": match.status,
+            "competition": match.competition,
+            "season": match.season,
+            "stage": match.stage,
+            "matchday": match.matchday,
+            "group": match.group,
+            "homeTeamId": match.homeTeam.id,
+            "homeTeam": match.homeTeam.name,
+            "awayTeamId": match.awayTeam.id,
+            "awayTeam": match.awayTeam.name,
+            "homeScore": score.home,
+            "awayScore": score.away,
+            "extraTimeHomeScore": getattr(match.score.extraTime, "home", None),
+            "extraTimeAwayScore": getattr(match.score.extraTime, "away", None),
+            "penaltiesHomeScore": getattr(match.score.penalties, "home", None),
+            "penaltiesAwayScore": getattr(match.score.penalties, "away", None),
+            "winner": match.score.winner,
+        }
+
+
+def standing_records(standings: Standings) -> Iterator[Record]:
+    """Yield a record per team of every standings table (total, home and away tables of every group)."""
+    for standing in standings.standings:
+        for record in standing.table:
+            yield {
+                "competition": standings.competition.name,
+                "type": standing.type,
+                "group": standing.group,
+                "position": record.position,
+                "teamId": record.team.id,
+                "team": record.team.fullName,
+                "playedGames": record.playedGames,
+                "won": record.won,
+                "draw": record.draw,
+                "lost": record.lost,
+                "goalsFor": record.goalsFor,
+                "goalsAgainst": record.goalsAgainst,
+                "goalDifference": record.goalDifference,
+                "points": record.points,
+                "form": record.form,
+            }
+
+
+def scorer_records(scorers: Iterable[Scorer]) -> Iterator[Record]:
+    """Yield a record per scorer (ranked in the order of the response)."""
+    for rank, scorer in enumerate(scorers, start=1):
+        yield {
+            "rank": rank,
+            "playerId": scorer.player.id,
+            "player": scorer.player.name,
+            "teamId": scorer.team.id,
+            "team": scorer.team.shortName,
+            "goals": scorer.goals,
+            "assists": scorer.assists,
+            "penalties": scorer.penalties,
+            "playedMatches": scorer.playedMatches,
+        }
+
+
+def team_records(teams: Iterable[Team]) -> Iterator[Record]:
+    """Yield a record per team."""
+    for team in teams:
+        yield {
+            "id": team.id,
+            "name": team.name,
+            "fullName": team.fullName,
+            "tla": team.tla,
+            "founded": team.founded,
+            "venue": team.venue,
+            "coach": getattr(team.coach, "name", None),
+        }
+
+
+def write_records(records: Iterable[Record], format: str, file: Optional[TextIO] = None):
+    """Write records one per line (`jsonl`), or as delimiter-separated values with a header line (`csv` and `tsv`).
+
+    Nothing is written (not even the header) if there are no records.
+    """
+    file = file or sys.stdout
+    if format == "jsonl":
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return
+
+    records = iter(records)
+    if (first := next(records, None)) is None:
+        return
+    writer = csv.DictWriter(file, fieldnames=list(first), delimiter=DELIMITERS[format], lineterminator="\n")
+    writer.writeheader()
+    writer.writerow(first)
+    writer.writerows(records)
@@ -0,0 +1,116 @@
+"""Parallel rendering of long lists of matches (`football --jobs N`).
+
+Top-level groups of matches (e.g. competitions or dates) are independent of one another, so each of them is formatted
+and rendered to ANSI text in a pool of processes, and the rendered groups are concatenated in order.
+Rendering takes two rounds: the width of every group is measured first, since all groups are rendered at the width
+of the widest one (as when the whole list is rendered at once), then groups are rendered and centered.
+"""
+
+from __future__ import annotations
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, TYPE_CHECKING
+from nested_panels import NestedPanels
+from profiling import span
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rows import MatchRow
+
+
+def split_groups(matches: list[MatchRow], group_by: list[str]) -> list[list[MatchRow]]:
+    """Split matches into top-level groups (by their first grouping key), in the order they're rendered."""
+    groups: dict[Any, list[MatchRow]] = {}
+    for match in matches:
+        groups.setdefault(getattr(match, str(group_by[0]), None), []).append(match)
+    return [group for _, group in NestedPanels().sort_panels(groups)]
+
+
+def _console(console_options: dict[str, Any]) -> Console:
+    from rich.console import Console
+
+    return Console(file=io.StringIO(), legacy_windows=False, **console_options)
+
+
+def _measure_group(matches: list[MatchRow], group_by: list[str], headers: list[str],
+                   console_options: dict[str, Any]) -> int:
+    """Return the maximum width of a group of matches."""
+    from output_formation import format_matches
+
+    console = _console(console_options)
+    return console.measure(format_matches(matches, group_by=group_by, headers=headers)).maximum
+
+
+def _render_group(matches: list[MatchRow], group_by: list[str], headers: list[str], width: int,
+                  console_options: dict[str, Any], justify: Optional[str]) -> tuple[int, list[str]]:
+    """Render a group of matches at some width.
+
+    :return: width of the rendered lines and the lines themselves (as ANSI text, without padding nor line breaks)
+    """
+    from rich.segment import Segment, Segments
+    from output_formation import format_matches
+
+    console = _console(console_options)
+    output = format_matches(matches, group_by=group_by, headers=headers)
+    options = console.options.update(justify=justify, height=None).update_width(width)
+    lines = list(Segment.split_lines(console.render(output, options)))
+    line_width, _ = Segment.get_shape(lines)
+    new_line = Segment.line()
+    console.print(Segments(segment for line in lines for segment in [*line, new_line]), end="")
+    return line_width, console.file.getvalue().split("\n")[:-1]
+
+
+def render_matches(
+    matches: list[MatchRow],
+    group_by: list[str],
+    headers: list[str],
+    jobs: int,
+    console: Optional[Console] = None,
+    justify: Optional[str] = "center"
+) -> Optional[str]:
+    """Render matches (see `output_formation.format_matches`) with top-level groups rendered in parallel.
+
+    The output is the same as printing the formatted matches (centered by default) to the console.
+
+    :param jobs: number of processes
+    :param console: console the output is rendered for (default is the terminal)
+    :param justify: `center` or `None` (left)
+
+    :return: rendered output, or `None` if matches can't be split (a single group) or the console isn't UTF-8
+    """
+    from rich.console import Console
+
+    console = console or Console()
+    groups = split_groups(matches, group_by) if matches and group_by else []
+    if len(groups) < 2 or not console.encoding.lower().startswith("utf"):
+        return None
+
+    console_options = {
+        "width": console.width,
+        "color_system": console.color_system,
+        "force_terminal": console.is_terminal,
+    }
+    count = len(groups)
+    with span("render_parallel", "rendering", objects=len(matches), groups=count, jobs=jobs):
+        with ProcessPoolExecutor(max_workers=min(jobs, count)) as pool:
+            width = console.width
+            if justify == "center":     # centered output is as wide as its widest group
+                widths = pool.map(_measure_group, groups, [group_by] * count, [headers] * count, [console_options] * count)
+                width = min(width, max(widths))
+            rendered = list(pool.map(_render_group, groups, [group_by] * count, [headers] * count, [width] * count,
+                                     [console_options] * count, [justify] * count))
+
+    output = io.StringIO()
+    if justify != "center":
+        for _, lines in rendered:
+            output.writelines(f"{line}\n" for line in lines)
+        return output.getvalue()
+
+    # Pad lines to the same width, then center them (as `rich.align.Align` does)
+    lines_width = max(line_width for line_width, _ in rendered)
+    excess_space = max(console.width - lines_width, 0)
+    left, right = " " * (excess_space // 2), " " * (excess_space - excess_space // 2)
+    for line_width, lines in rendered:
+        shape_padding = " " * (lines_width - line_width)
+        output.writelines(f"{left}{line}{shape_padding}{right}\n" for line in lines)
+    return output.getvalue()
@@ -0,0 +1,290 @@
+"""Plain-text rendering (`football --plain`): aligned monospace text written line by line, without `rich`.
+
+Building and rendering nested panels, tables and columns with `rich` is the slowest part of large outputs
+(e.g. season-long match lists or long squads). The plain renderer groups rows the same way (see `NestedPanels`),
+computes column widths in one pass over all rows and styles cells with raw ANSI codes (unless colors are disabled).
+"""
+
+from __future__ import annotations
+import os
+import sys
+import unicodedata
+from typing import Any, Iterable, Optional, Sequence, TextIO, TYPE_CHECKING
+from utils import display
+
+if TYPE_CHECKING:
+    from models import Standings, Team
+    from rows import MatchRow, ScorerRow
+
+
+ANSI_CODES = {
+    "bold": "1", "dim": "2",
+    "black": "30", "red": "31", "green": "32", "yellow": "33", "blue": "34", "magenta": "35", "cyan": "36", "white": "37",
+}
+LEVEL_COLORS = ["cyan", "yellow", "green"]      # same as nested panels
+WINNER_COLORS = {"HOME_TEAM": ("green", "red"), "AWAY_TEAM": ("red", "green"), "DRAW": ("yellow", "yellow")}
+SEPARATOR = "  "
+
+Column = tuple[str, str, str]   # title, justify (left/right/center), style
+
+
+def _width(text: str) -> int:
+    """Return the number of terminal cells taken by a string."""
+    if text.isascii():
+        return len(text)
+    return sum(
+        0 if unicodedata.combining(char) else 2 if unicodedata.east_asian_width(char) in "WF" else 1
+        for char in text
+    )
+
+
+def _justify(text: str, width: int, justify: str) -> str:
+    padding = width - _width(text)
+    if padding <= 0:
+        return text
+    if justify == "right":
+        return " " * padding + text
+    if justify == "center":
+        return " " * (padding // 2) + text + " " * (padding - padding // 2)
+    return text + " " * padding
+
+
+class PlainWriter:
+    """Write styled lines and tables to a file (the standard output by default)."""
+
+    def __init__(self, file: Optional[TextIO] = None, color: Optional[bool] = None):
+        self.file = file or sys.stdout
+        if color is None:
+            color = "NO_COLOR" not in os.environ and (self.file.isatty() or "FORCE_COLOR" in os.environ)
+        self.color = color
+        self._codes: dict[str, str] = {}
+
+    def style(self, text: str, style: Optional[str]) -> str:
+        """Wrap text in the ANSI codes of a style (e.g. `green bold`, words with no ANSI code are ignored)."""
+        if not self.color or not style or not text:
+            return text
+        if (codes := self._codes.get(style)) is None:
+            codes = self._codes[style] = ";".join(ANSI_CODES[word] for word in style.split() if word in ANSI_CODES)
+        return f"\x1b[{codes}m{text}\x1b[0m" if codes else text
+
+    def line(self, text: str = "", indent: int = 0):
+        self.file.write(" " * indent + text + "\n")
+
+    def table(self, rows: Sequence[Sequence[str]], columns: Sequence[Column], indent: int = 0, show_header: bool = True,
+              row_styles: dict[str, str] = {}):
+        """Write a table with aligned columns.
+
+        :param rows: cells display strings
+        :param row_styles: styles of rows by row number (1-based), see `utils.add_rows`
+        """
+        widths = self.column_widths(rows, columns if show_header else None)
+        if show_header:
+            self.line(SEPARATOR.join(
+                self.style(_justify(title, width, justify), "bold dim")
+                for (title, justify, _), width in zip(columns, widths)
+            ).rstrip(), indent)
+        default_style = row_styles.get("default")
+        for idx, row in enumerate(rows, start=1):
+            row_style = row_styles.get(str(idx), default_style)
+            self.line(SEPARATOR.join(
+                self.style(_justify(cell, width, justify), f"{style} {row_style}" if row_style else style)
+                for cell, (_, justify, style), width in zip(row, columns, widths)
+            ).rstrip(), indent)
+
+    @staticmethod
+    def column_widths(rows: Iterable[Sequence[str]], columns: Optional[Sequence[Column]] = None) -> list[int]:
+        """Return the width of every column (the widest of its cells and title)."""
+        widths = [_width(title) for title, _, _ in columns] if columns else []
+        for row in rows:
+            if len(widths) < len(row):
+                widths += [0] * (len(row) - len(widths))
+            for i, cell in enumerate(row):
+                if (width := _width(cell)) > widths[i]:
+                    widths[i] = width
+        return widths
+
+
+def _walk(panels: dict, sort, level: int = 0) -> Iterable[tuple[int, str, Any]]:
+    """Yield (level, title, value) of the groups of nested panels, in the order panels are constructed.
+
+    Like nested panels, levels with a single group are merged into their parent (titles are joined with `|`),
+    and leaf values are yielded with an empty title.
+    """
+    for title, value in sort(panels):
+        titles = [title] if title else []
+        while isinstance(value, dict) and len(value) == 1:
+            (sub_title, value), = value.items()
+            if sub_title:
+                titles.append(sub_title)
+        yield level, " | ".join(map(str, titles)), None
+        if isinstance(value, dict):
+            yield from _walk(value, sort, level + 1)
+        else:
+            yield level + 1, "", value
+
+
+def write_matches(matches: list[MatchRow], group_by: list[str] = [], headers: list[str] = [],
+                  writer: Optional[PlainWriter] = None):
+    """Write a set of matches after grouping them (see `output_formation.format_matches`)."""
+    from nested_panels import NestedPanels
+
+    writer = writer or PlainWriter()
+    if not matches:
+        writer.line(writer.style("No Available Data", "red bold"))
+        return
+
+    headers = [header for header in headers if header not in ["date", "time"]] + \
+        [header for header in ["date", "time"] if header in headers]    # same order as rendered tables
+    panels = NestedPanels()
+    for match in matches:
+        panels.get([getattr(match, str(attr), None) for attr in group_by or [None]], factory=list).append(match)
+
+    lines = []      # (level, cells, styles) of every line, to compute widths of all tables at once
+    for level, title, matches_ in _walk(panels.nest(), panels.sort_panels):
+        if matches_ is None:
+            if title:
+                lines.append((level, title, LEVEL_COLORS[level % len(LEVEL_COLORS)] + " bold"))
+            continue
+        for match in matches_:
+            home_color, away_color = WINNER_COLORS.get(match.winner, ("white", "white"))
+            (_, home, away), *others = match.results
+            attributes = [display(getattr(match, str(header), None)) for header in headers]
+            lines.append((level, (match.home_name or "", f"{home} : {away}", match.away_name or "", *attributes,
+                                  "live" if match.is_live else ""),
+                          (f"{home_color} bold", "bold", f"{away_color} bold", *["blue"] * len(headers), "green")))
+            for label, home, away in others:
+                lines.append((level, (label, f"{home} : {away}"), ("white dim", "dim")))
+
+    widths = writer.column_widths(cells for _, cells, _ in lines if isinstance(cells, tuple))
+    justify = ["right", "center", "left"] + ["left"] * (len(widths) - 3)
+    for level, cells, styles in lines:
+        if isinstance(cells, str):      # group title
+            writer.line(writer.style(cells, styles), indent=2 * level)
+            continue
+        writer.line(SEPARATOR.join(
+            writer.style(_justify(cell, width, justify_), style)
+            for cell, width, justify_, style in zip(cells, widths, justify, styles)
+        ).rstrip(), indent=2 * level)
+
+
+def write_team_stats(team_id: int, matches: list[MatchRow], writer: Optional[PlainWriter] = None):
+    """Write number of matches played, won, drawn and lost by a team (see `output_formation.format_team_matches`)."""
+    writer = writer or PlainWriter()
+    stats = {"Played": 0, "Won": 0, "Drawn": 0, "Lost": 0, "Scheduled": 0}
+    for match in matches:
+        if match.winner not in WINNER_COLORS:
+            stats["Scheduled"] += 1
+            continue
+        stats["Played"] += 1
+        if match.winner == "DRAW":
+            stats["Drawn"] += 1
+        elif (match.winner == "HOME_TEAM") == (match.home_id == team_id):
+            stats["Won"] += 1
+        else:
+            stats["Lost"] += 1
+
+    if stats["Played"] == 0:
+        return
+    if stats["Scheduled"] == 0:
+        del stats["Scheduled"]
+    styles = {"Played": "blue", "Won": "green", "Drawn": "yellow", "Lost": "red", "Scheduled": ""}
+    writer.line()
+    writer.table([[str(value) for value in stats.values()]],
+                 columns=[(title, "center", f"{styles[title]} bold") for title in stats])
+
+
+def write_standings(standings_set: Standings, writer: Optional[PlainWriter] = None):
+    """Write standings table(s) (see `output_formation.format_standings`)."""
+    from data_index import get_index
+    from rows import StandingRow
+
+    writer = writer or PlainWriter()
+    standings = [standing for standing in standings_set.standings if standing.type == "TOTAL"] \
+        if standings_set.competition.is_league \
+        else standings_set.standings
+    if not standings:
+        writer.line(writer.style("No Available Data", "red bold"))
+        return
+
+    index = get_index()
+    code = standings_set.competition.code
+    columns = [("", "right", "bold"), ("TEAM", "left", "bold"), *[(title, "right", "") for title in
+               ["MP", "W", "D", "L", "GF", "GA", "GD"]], ("PTS", "right", "bold")]
+    for standing in standings:
+        if standing.group:
+            writer.line(writer.style(standing.group, "blue bold"))
+        writer.table([StandingRow(record).cells for record in standing.table], columns,
+                     row_styles=index.position_colors(code))
+        writer.line()
+
+    for zone in index.zones(code):
+        writer.line(f"{writer.style('■', zone['color'])} {zone['name']}")
+
+
+def write_top_scorers(scorers: list[ScorerRow], writer: Optional[PlainWriter] = None):
+    """Write player name, goals, assists and penalties of top scorers (see `output_formation.format_top_scorers`)."""
+    writer = writer or PlainWriter()
+    columns = [("", "right", "dim"), ("Player", "left", "yellow bold"), ("Team", "left", "blue"),
+               ("Goals", "right", "green bold"), ("Assists", "right", "cyan"), ("Penalties", "right", "red"),
+               ("Played", "right", "yellow")]
+    writer.table([(str(idx), *scorer.cells) for idx, scorer in enumerate(scorers, start=1)], columns)
+
+
+def write_teams(teams: list[Team], writer: Optional[PlainWriter] = None):
+    """Write competition teams info (see `output_formation.format_teams`)."""
+    writer = writer or PlainWriter()
+    columns = [("Full Name (ID)", "left", "yellow bold"), ("Founded", "left", "blue"), ("Stadium", "left", "green"),
+               ("Coach", "left", "red")]
+    writer.table([
+        (f"{team.fullName} ({team.tla})", display(team.founded), display(team.venue),
+         display(getattr(team.coach, "name", None)))
+        for team in teams
+    ], columns)
+
+
+def write_team(team: Team, writer: Optional[PlainWriter] = None):
+    """Write team info and squad (see `output_formation.format_team`)."""
+    writer = writer or PlainWriter()
+    if not team.squad:
+        writer.line(writer.style("No Available Data", "red bold"))
+        return
+
+    team_info = {
+        "Team": team.fullName,
+        "Country": getattr(team.area, "name", None),
+        "Founded": team.founded,
+        "Stadium": team.venue,
+        "Coach": getattr(team.coach, "name", None),
+    }
+    if team_info["Team"] == team_info["Country"]:
+        del team_info["Country"]
+    for title, value in team_info.items():
+        writer.line(f"{writer.style(title + ':', 'blue bold')} {writer.style(display(value), 'green bold')}")
+
+    writer.line()
+    writer.line(writer.style("Squad", "blue bold"))
+    columns = [("Name", "left", "green bold"), ("Nationality", "left", "blue"), ("Position", "left", "blue"),
+               ("Shirt Number", "right", "blue"), ("DOB", "left", "blue")]
+    writer.table([
+        (display(player.name), display(player.nationality), display(player.position).replace("Offence", "Attack"),
+         display(player.shirtNumber), display(player.dateOfBirth))
+        for player in team.squad
+    ], columns)
+
+
+def write_index_list(kind: str, writer: Optional[PlainWriter] = None):
+    """Write all available competitions or teams (see `output_formation.format_competitions_list`)."""
+    from data_index import get_index
+
+    writer = writer or PlainWriter()
+    index = get_index()
+    if kind == "competitions":
+        columns = [("ID", "left", "yellow bold"), ("Name", "left", "blue bold"), ("Region", "left", "green bold"),
+                   ("Type", "left", "red bold")]
+        rows = [(c["code"], c["name"], c["area"], c["type"]) for c in index.competitions.values()]
+    else:
+        columns = [("ID", "left", "yellow bold"), ("Full Name", "left", "blue bold"),
+                   ("Short Name", "left", "green bold"), ("Country", "left", "red bold")]
+        rows = [(t["tla"], t["full_name"] or "", t["short_name"] or "", t["country"]) for t in index.teams_by_id.values()]
+        rows.sort(key=lambda row: (row[3], row[2]))
+    writer.table([tuple(map(display, row)) for row in rows], columns)
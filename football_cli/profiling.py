@@ -0,0 +1,156 @@
+"""Lightweight profiler of command stages (enabled through `football --profile`).
+
+Stages are wrapped in timing spans (optionally carrying byte and object counts), which are summarized in a table
+and can be exported as a Chrome trace (https://ui.perfetto.dev or chrome://tracing).
+Spans cost next to nothing while profiling is disabled.
+"""
+
+from __future__ import annotations
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Iterator, NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+
+class Span(NamedTuple):
+    name: str
+    category: str
+    start: float        # seconds since profiling was enabled
+    duration: float     # seconds
+    thread_id: int
+    args: dict[str, Any]
+
+
+_enabled = False
+_started_at = 0.0
+_spans: list[Span] = []
+_lock = threading.Lock()
+
+
+def enable():
+    """Start recording spans (discarding any previously recorded ones)."""
+    global _enabled, _started_at
+    with _lock:
+        _spans.clear()
+        _started_at = time.perf_counter()
+        _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+    """Record how long the wrapped block takes.
+
+    :param name: stage name
+    :param category: group of stages (network, validation, callbacks, grouping, rendering)
+    :param args: extra info about the stage (e.g. `bytes`, `objects`), which can also be added to the yielded dictionary
+
+    :return: dictionary of span arguments
+    """
+    if not _enabled:
+        yield args
+        return
+
+    start = time.perf_counter()
+    try:
+        yield args
+    finally:
+        end = time.perf_counter()
+        with _lock:
+            _spans.append(Span(name, category, start - _started_at, end - start, threading.get_ident(), args))
+
+
+def profiled(category: str) -> Callable:
+    """Decorator recording a span (named after the function) for every call of a function."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with span(func.__name__, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count_objects(data: Any) -> int:
+    """Count the containers (dicts and lists) of parsed JSON data."""
+    count = 0
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            count += 1
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            count += 1
+            stack.extend(item)
+    return count
+
+
+def get_spans() -> list[Span]:
+    with _lock:
+        return list(_spans)
+
+
+def summary_table() -> Table:
+    """Return a table of recorded stages (number of calls, time, bytes and objects), slowest first."""
+    from rich.table import Table
+
+    stages: dict[tuple[str, str], dict[str, Any]] = {}
+    for s in get_spans():
+        stage = stages.setdefault((s.category, s.name), {"calls": 0, "total": 0.0, "max": 0.0, "bytes": 0, "objects": 0})
+        stage["calls"] += 1
+        stage["total"] += s.duration
+        stage["max"] = max(stage["max"], s.duration)
+        stage["bytes"] += s.args.get("bytes") or 0
+        stage["objects"] += s.args.get("objects") or 0
+    wall_time = time.perf_counter() - _started_at
+
+    table = Table(title=f"Profile ({wall_time * 1000:.1f}ms)", header_style="bold dim", title_style="bold")
+    for column in ["Category", "Stage", "Calls", "Total (ms)", "%", "Max (ms)", "Bytes", "Objects"]:
+        table.add_column(column, justify="left" if column in ["Category", "Stage"] else "right")
+    for (category, name), stage in sorted(stages.items(), key=lambda item: -item[1]["total"]):
+        table.add_row(
+            category,
+            name,
+            str(stage["calls"]),
+            f"{stage['total'] * 1000:.1f}",
+            f"{stage['total'] / wall_time:.0%}" if wall_time else "",
+            f"{stage['max'] * 1000:.1f}",
+            str(stage["bytes"] or ""),
+            str(stage["objects"] or ""),
+        )
+    return table
+
+
+def write_chrome_trace(filepath: str):
+    """Write recorded spans as Chrome trace events (complete events, with timestamps in microseconds)."""
+    pid = os.getpid()
+    events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "football"}}]
+    events += [{
+        "name": s.name,
+        "cat": s.category,
+        "ph": "X",
+        "ts": round(s.start * 1e6, 3),
+        "dur": round(s.duration * 1e6, 3),
+        "pid": pid,
+        "tid": s.thread_id,
+        "args": s.args,
+    } for s in get_spans()]
+    with open(filepath, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
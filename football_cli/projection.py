@@ -0,0 +1,75 @@
+"""Field projection: parse only the parts of an API response that a command renders.
+
+A projection maps field names to the projection of their (nested) model, or to `None` to parse the whole field:
+    {"aggregates": None}                                    # head-to-head summary, without the matches
+    {"teams": {"name": None, "tla": None, "coach": {"name": None}}}
+
+Fields left out of a projection are neither validated nor built, they're set to `None` (or an empty list for
+required list fields) instead. Root validators still run, so a projection must include the fields they use
+(e.g. `utcDate` and `status` of matches, which are needed to derive their date and time).
+"""
+
+from __future__ import annotations
+from typing import Any, Optional
+from pydantic import ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.main import BaseModel
+
+Projection = dict[str, Optional["Projection"]]
+
+
+def _parse_field(field: ModelField, value: Any, projection: Optional[Projection], model: type[BaseModel],
+                 values: dict[str, Any], trusted: bool) -> Any:
+    """Parse the raw value of a field.
+
+    :raise ValidationError: if the value is invalid (only checked for untrusted responses)
+    """
+    if value is None:
+        return None
+
+    if projection is not None:      # nested model, projected in turn
+        if field.shape == SHAPE_LIST:
+            return [parse(field.type_, item, projection, trusted) for item in value]
+        if field.shape != SHAPE_SINGLETON:
+            raise TypeError(f"Unsupported projection of field {field.name!r}")
+        return parse(field.type_, value, projection, trusted)
+
+    if trusted:
+        import decoders
+        convert = decoders.field_converter(field)
+        return value if convert is None else convert(value)
+
+    value, errors = field.validate(value, values, loc=field.alias, cls=model)
+    if errors:
+        raise ValidationError([errors], model)
+    return value
+
+
+def parse(model: type[BaseModel], data: dict[str, Any], projection: Projection, trusted: bool = False) -> BaseModel:
+    """Parse a response into a model, only including the fields of a projection.
+
+    :param trusted: skip validation of the included fields (see `decoders`)
+
+    :raise ValidationError: if an included field is missing or invalid
+    :raise ValueError: if the projection includes fields the model doesn't have
+    """
+    if unknown := projection.keys() - model.__fields__.keys():
+        raise ValueError(f"Unknown fields of {model.__name__}: {', '.join(sorted(unknown))}")
+
+    values = {}
+    for name, field in model.__fields__.items():
+        if name not in projection:
+            values[name] = [] if field.required and field.shape == SHAPE_LIST else None
+        elif name in data:
+            values[name] = _parse_field(field, data[name], projection[name], model, values, trusted)
+        elif field.required:
+            raise ValidationError([ErrorWrapper(MissingError(), loc=name)], model)
+        else:
+            values[name] = field.get_default()
+
+    for _, validator in model.__post_root_validators__:
+        values = validator(model, values)
+
+    return model.construct(_fields_set=data.keys() & projection.keys(), **values)
@@ -0,0 +1,113 @@
+import os
+import json
+import time
+from typing import Any, Callable, Mapping, Optional
+from dotenv import load_dotenv
+from utils import DATA_DIR, file_lock
+
+
+load_dotenv()
+
+
+class RateLimiter:
+    """Token bucket shared by all `football` processes on the machine.
+
+    The bucket mirrors the API quota, which is a number of requests per minute reset at fixed points in time.
+    Its state is kept in `data/rate_limit.json` (guarded by a lock file), and it's synced with the quota headers
+    returned by the API so that other clients using the same key are taken into account.
+    If the state file can't be written (e.g. read-only installation), the state is kept in memory instead,
+    so that requests are still limited within the current process.
+    """
+
+    STATE_FILE = os.path.join(DATA_DIR, "rate_limit.json")
+    LOCK_FILE = "rate_limit.lock"
+    REQUESTS_PER_MINUTE = int(os.getenv("FOOTBALL_CLI_REQUESTS_PER_MINUTE", "10"))
+    PERIOD = 60
+
+    _memory_state: Optional[dict[str, Any]] = None      # state of the current process if the state file isn't writable
+
+    def acquire(self, on_wait: Optional[Callable[[float], None]] = None) -> float:
+        """Take a token from the bucket, waiting for the quota to be reset if it's empty.
+
+        :param on_wait: function called with the number of seconds to wait before sleeping
+
+        :return: total time spent waiting (in seconds)
+        """
+        waited = 0.0
+        while True:
+            with file_lock(self.LOCK_FILE):
+                state = self._load_state()
+                now = time.time()
+                if now >= state["reset_at"]:
+                    state["tokens"] = state["capacity"]
+                    state["reset_at"] = now + self.PERIOD
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    self._save_state(state)
+                    return waited
+                delay = state["reset_at"] - now
+
+            if on_wait:
+                on_wait(delay)
+            time.sleep(delay)
+            waited += delay
+
+    def update(self, headers: Mapping[str, str]):
+        """Sync the bucket with the quota headers of an API response."""
+        available, reset = self._parse_headers(headers)
+        if available is None or reset is None:
+            return
+        with file_lock(self.LOCK_FILE):
+            state = self._load_state()
+            state["capacity"] = max(state["capacity"], available + 1)     # the response itself used one request
+            state["tokens"] = available
+            state["reset_at"] = time.time() + reset
+            self._save_state(state)
+
+    def exhaust(self, headers: Mapping[str, str]) -> float:
+        """Empty the bucket after the API rejected a request (HTTP 429).
+
+        :return: number of seconds until the quota is reset
+        """
+        _, reset = self._parse_headers(headers)
+        with file_lock(self.LOCK_FILE):
+            state = self._load_state()
+            if reset is not None:
+                state["reset_at"] = time.time() + reset
+            state["tokens"] = 0
+            self._save_state(state)
+            return max(state["reset_at"] - time.time(), 0)
+
+    @staticmethod
+    def _parse_headers(headers: Mapping[str, str]) -> tuple[Optional[int], Optional[int]]:
+        """Return number of available requests and seconds until the quota is reset."""
+        try:
+            available = int(headers["X-Requests-Available-Minute"])
+        except (KeyError, ValueError):
+            available = None
+        try:
+            reset = int(headers["X-RequestCounter-Reset"])
+        except (KeyError, ValueError):
+            reset = None
+        return available, reset
+
+    def _load_state(self) -> dict[str, Any]:
+        if self._memory_state is not None:
+            return self._memory_state
+        try:
+            with open(self.STATE_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"capacity": self.REQUESTS_PER_MINUTE, "tokens": self.REQUESTS_PER_MINUTE, "reset_at": 0}
+
+    def _save_state(self, state: dict[str, Any]):
+        if self._memory_state is not None:
+            type(self)._memory_state = state
+            return
+        tmp_filepath = f"{self.STATE_FILE}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_filepath, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_filepath, self.STATE_FILE)     # atomic, so that other processes never see a partial state
+        except OSError:
+            type(self)._memory_state = state
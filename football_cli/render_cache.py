@@ -0,0 +1,140 @@
+"""Disk-backed cache of rendered command output (ANSI text) under `data/render_cache`.
+
+Entries are keyed by a digest of the API response, the display options of the command (e.g. grouping and headers)
+and the console it's printed to (width, color system and encoding), so that printing the same response again
+skips decoding, formatting and rendering altogether.
+Entries are evicted in least recently used order once the cache exceeds its byte budget.
+"""
+
+from __future__ import annotations
+import os
+import json
+import hashlib
+from typing import Any, Optional, TYPE_CHECKING
+from dotenv import load_dotenv
+from utils import DATA_DIR, file_lock
+
+if TYPE_CHECKING:
+    import click
+
+
+load_dotenv()
+
+# Modules whose changes affect rendered output (stale entries are never hit after an upgrade)
+FORMATTING_SOURCES = ["output_formation.py", "nested_panels.py", "rows.py", "models.py"]
+
+
+def _sources_signature() -> list[int]:
+    from data_index import _source_mtimes     # position colors and zones of standings
+
+    directory = os.path.dirname(__file__)
+    mtimes = [os.stat(os.path.join(directory, filename)).st_mtime_ns for filename in FORMATTING_SOURCES]
+    return mtimes + list(_source_mtimes().values())
+
+
+def response_digest(data: dict[str, Any]) -> str:
+    """Return a digest of a decoded API response."""
+    raw = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class RenderCache:
+    """Cache of the rendered output of a command for a specific response.
+
+    Each entry is stored in a separate text file named after its key. Reading an entry refreshes its modification time,
+    which is used as its last access time when evicting entries.
+    """
+
+    ENABLED = os.getenv("USE_RENDER_CACHE", "1") == "1"
+    MAX_BYTES = int(os.getenv("FOOTBALL_CLI_RENDER_CACHE_BYTES", 64 * 1024 * 1024))
+    CACHE_DIR = os.path.join(DATA_DIR, "render_cache")
+
+    def __init__(self, view: str, data: dict[str, Any], options: dict[str, Any] = {}, console: dict[str, Any] = {}):
+        """
+        :param view: name of the rendered view (e.g. `matches`)
+        :param data: API response
+        :param options: display options of the command (e.g. `group_by`, `headers` and `show_id`)
+        :param console: console properties affecting rendered output (e.g. width and color system)
+        """
+        self.key = self.get_key(view, response_digest(data), options, console)
+        self.filepath = os.path.join(self.CACHE_DIR, f"{self.key}.ansi")
+
+    def get(self) -> Optional[str]:
+        """Return cached output if it exists, `None` otherwise."""
+        if not self.ENABLED:
+            return None
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                output = f.read()
+            os.utime(self.filepath)     # mark as recently used
+        except OSError:
+            return None
+        return output
+
+    def set(self, output: str):
+        """Store rendered output, then evict least recently used entries if the cache exceeds its byte budget."""
+        if not self.ENABLED or len(output.encode("utf-8")) > self.MAX_BYTES:
+            return
+        tmp_filepath = f"{self.filepath}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(tmp_filepath, "w", encoding="utf-8") as f:
+                f.write(output)
+            os.replace(tmp_filepath, self.filepath)     # atomic, so that concurrent readers never see partial entries
+        except OSError:     # e.g. read-only installation, the output just isn't cached
+            return
+        self.evict()
+
+    @classmethod
+    def evict(cls):
+        """Remove least recently used entries until the total size of the cache is within its byte budget."""
+        with file_lock("render_cache.lock"):
+            entries = []
+            with os.scandir(cls.CACHE_DIR) as it:
+                for entry in it:
+                    if entry.name.endswith(".ansi"):
+                        try:
+                            stat = entry.stat()
+                        except OSError:     # removed by another process
+                            continue
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= cls.MAX_BYTES:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total -= size
+
+    @staticmethod
+    def get_key(view: str, digest: str, options: dict[str, Any], console: dict[str, Any]) -> str:
+        """Return a digest identifying rendered output."""
+        raw = json.dumps([view, digest, options, console, _sources_signature()], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def for_command(ctx: click.Context, view: str, data: dict[str, Any], **options: Any) -> Optional[RenderCache]:
+    """Return the render cache of a command's output for the current console.
+
+    :param ctx: command context
+    :param view: name of the rendered view
+    :param data: API response
+    :param options: display options of the command
+
+    :return: render cache, or `None` if the output isn't rendered with `rich` at once (`--output`, `--plain` and `--stream`)
+    """
+    root_params = ctx.find_root().params
+    if not RenderCache.ENABLED or any(root_params.get(name) for name in ["output_format", "plain", "stream"]):
+        return None
+
+    from rich.console import Console
+
+    console = Console()
+    return RenderCache(view, data, options, console={
+        "width": console.width,
+        "color_system": console.color_system,
+        "encoding": console.encoding,
+    })
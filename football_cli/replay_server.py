@@ -0,0 +1,136 @@
+"""Local stand-in for the football-data.org API serving recorded cassettes (see `cassettes.py`).
+
+Point the CLI at it to run commands without network access or an API key:
+    football_replay --port 8765 &
+    FOOTBALL_CLI_BASE_URL=http://127.0.0.1:8765/v4 football competition PL standings
+
+Responses are delayed by the latency they were recorded with (or a fixed latency), and the request quota of the API
+is enforced with the same headers (and HTTP 429 errors) as the real API, so caching and rate limiting behave
+the same as they do against the API, deterministically.
+"""
+
+import math
+import json
+import time
+import threading
+import rich_click as click
+from typing import Any, Optional
+from urllib.parse import urlsplit, parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from cassettes import CASSETTE_DIR, get_key, load_cassettes, find_similar
+
+
+class Quota:
+    """Fixed-window request quota (the window starts with the first request after the previous one is over)."""
+
+    def __init__(self, requests_per_period: int, period: int = 60):
+        self.requests_per_period = requests_per_period
+        self.period = period
+        self.used = 0
+        self.reset_at = 0.0
+        self._lock = threading.Lock()
+
+    def consume(self) -> tuple[bool, int, int]:
+        """Count a request against the quota.
+
+        :return: whether the request is allowed, number of available requests and seconds until the quota is reset
+        """
+        with self._lock:
+            now = time.time()
+            if now >= self.reset_at:
+                self.used = 0
+                self.reset_at = now + self.period
+            allowed = self.used < self.requests_per_period
+            if allowed:
+                self.used += 1
+            return allowed, self.requests_per_period - self.used, math.ceil(self.reset_at - now)
+
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"     # keep-alive, like the real API
+    server: "ReplayServer"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.strip("/").removeprefix("v4").strip("/")
+        params = dict(parse_qsl(url.query))
+
+        allowed, available, reset = self.server.quota.consume()
+        headers = {"X-API-Version": "v4", "X-Requests-Available-Minute": available, "X-RequestCounter-Reset": reset}
+        if not allowed:
+            message = f"You reached your request limit. Wait {reset} seconds."
+            return self._respond(429, json.dumps({"message": message, "errorCode": 429}), headers)
+
+        match = "exact"
+        cassette = self.server.cassettes.get(get_key(path, params))
+        if cassette is None:
+            match = "similar"
+            cassette = find_similar(self.server.cassettes, path, params)
+        if cassette is None:
+            message = f"No cassette recorded for {self.path}"
+            return self._respond(404, json.dumps({"message": message, "errorCode": 404}), {**headers, "X-Replay": "missing"})
+
+        latency = self.server.latency if self.server.latency is not None else cassette.get("latency", 0)
+        time.sleep(latency)
+        self._respond(cassette["status"], cassette["body"], {**headers, "X-Replay": match})
+
+    def _respond(self, status: int, body: str, headers: dict[str, Any]):
+        content = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], cassettes: dict[str, dict[str, Any]], quota: Quota,
+                 latency: Optional[float] = None, verbose: bool = False):
+        """
+        :param cassettes: cassettes by key
+        :param quota: request quota to enforce
+        :param latency: fixed latency in seconds (`None` to use the recorded latency of each response)
+        :param verbose: log requests to stderr
+        """
+        super().__init__(address, ReplayRequestHandler)
+        self.cassettes = cassettes
+        self.quota = quota
+        self.latency = latency
+        self.verbose = verbose
+
+
+@click.command()
+@click.option("--host", type=str, default="127.0.0.1", show_default=True, help="Address to listen on.")
+@click.option("--port", type=int, default=8765, show_default=True, help="Port to listen on.")
+@click.option("--cassettes", "cassette_dir", type=click.Path(file_okay=False), default=CASSETTE_DIR,
+              help="Directory of recorded responses (FOOTBALL_CLI_CASSETTE_DIR).")
+@click.option("--latency", type=click.FloatRange(min=0), default=None,
+              help="Fixed latency in milliseconds (defaults to the recorded latency of each response).")
+@click.option("--requests-per-minute", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Request quota to enforce (10 for the free tier).")
+@click.option("--verbose", is_flag=True, help="Log requests.")
+def main(host, port, cassette_dir, latency, requests_per_minute, verbose):
+    """Serve recorded API responses (cassettes) locally."""
+    cassettes = load_cassettes(cassette_dir)
+    latency = latency / 1000 if latency is not None else None
+    server = ReplayServer((host, port), cassettes, Quota(requests_per_minute), latency, verbose)
+    click.echo(f"Replaying {len(cassettes)} cassettes from {cassette_dir}")
+    click.echo(f"Set FOOTBALL_CLI_BASE_URL=http://{host}:{server.server_port}/v4 to use it (press Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
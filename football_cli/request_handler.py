@@ -1,10 +1,24 @@
-import requests
+from __future__ import annotations
 import os
-from typing import Any
+import weakref
+from typing import Any, Optional, TYPE_CHECKING
 from dotenv import load_dotenv
 from rich.console import Console
 from exception_handling import ConnectionError, HTTPError, RequestError
+from response_cache import ResponseCache
+from rate_limiter import RateLimiter
 from utils import save_json
+import cassettes
+import profiling
+import metrics
+
+if TYPE_CHECKING:
+    from typing import TypeVar
+    from http_session import RequestTiming
+    from models import BaseModel
+    from projection import Projection
+
+    Model = TypeVar("Model", bound=BaseModel)
 
 
 load_dotenv()
@@ -14,29 +28,112 @@ class RequestHandler():
     BASE_URL = os.getenv("FOOTBALL_CLI_BASE_URL", "https://api.football-data.org/v4")
     API_KEY = os.getenv("FOOTBALL_CLI_API_KEY")
     SAVE_API_RESPONSE = os.getenv("SAVE_API_RESPONSE") == "1"
+    SHOW_REQUEST_TIMING = os.getenv("SHOW_REQUEST_TIMING") == "1"
+    MAX_ATTEMPTS = 3        # Requests rejected for exceeding the quota (HTTP 429) are retried once the quota is reset
     ALLOWED_PARAMS = [      # Parameters that are expected by the API
         "matchday", "season", "venue", "competitions", "date", "dateFrom", "dateTo", "status", "stage", "group", "limit",
         "ids", "areas", "lineup", "e", "offset"
     ]
 
-    def __init__(self, path: str, params: dict[str, Any] = {}, headers: dict[str, Any] = {}):
+    def __init__(self, path: str, params: dict[str, Any] = {}, headers: dict[str, Any] = {}, show_status: bool = True):
         self.params = self.get_request_params(params)
+        self.path = path
         self.url = f"{RequestHandler.BASE_URL}/{path}"
         self.headers = {"X-Auth-Token": RequestHandler.API_KEY, **headers}
+        self.cache = ResponseCache(path, self.params)
+        self.rate_limiter = RateLimiter()
+        self.timing: Optional["RequestTiming"] = None
+        self.from_cache = False     # whether the response was read from the cache
+        self.response: Optional[dict[str, Any]] = None
+        self._caching: Optional[weakref.finalize] = None     # pending write of a received response to the cache
+        self.show_status = show_status      # status spinner (disabled when sending requests from multiple threads)
 
     def send_request(self) -> dict[str, Any]:
-        with Console().status("[bold green]Fetching data from api.football-data.org ..."):
+        with profiling.span("send_request", "network", path=self.path) as args:
+            data = self.response = self._send_request()
+            args["cached"] = self.timing is None
+            args["bytes"] = self.timing.size if self.timing else None
+            return data
+
+    def parse(self, model: type[Model], fields: Optional[Projection] = None) -> Model:
+        """Parse the response (see `BaseModel.from_response`).
+
+        Cached responses are decoded without validation only if a model was fully validated from them before,
+        which is recorded in the cache once the response is parsed successfully (without projection).
+        A response received from the API is only written to the cache at this point (see `_cache_later`).
+
+        :param fields: fields to parse (see `projection`)
+
+        :raise ValidationError: if the response is invalid
+        """
+        trusted = self.from_cache and self.cache.validated
+        validated = False
+        try:
+            parsed = model.from_response(self.response, trusted=trusted, fields=fields)
+            validated = not trusted and fields is None
+            return parsed
+        finally:
+            if self._caching is not None and self._caching.detach() is not None:
+                self.cache.set(self.response, validated=validated)
+            elif validated and self.from_cache:
+                self.cache.mark_validated(self.response)
+
+    def _cache_later(self, data: dict[str, Any]):
+        """Write a received response to the cache once it's parsed, so that it's written once along with whether
+        a model was validated from it, or once the handler is discarded if it's never parsed
+        (e.g. the output of the command was found in the render cache).
+        """
+        self._caching = weakref.finalize(self, self.cache.set, data)
+
+    def _send_request(self) -> dict[str, Any]:
+        if not cassettes.RECORD and self.cache.ENABLED:     # record mode always hits the API
+            cached = self.cache.get()
+            metrics.record_cache(self.path, hit=cached is not None)
+            if cached is not None:
+                self.from_cache = True
+                return cached
+
+        import requests         # only imported when a request is actually sent (not on cache hits)
+        import http_session
+
+        message = "[bold green]Fetching data from api.football-data.org ..."
+        with Console(quiet=not self.show_status).status(message) as status:
+            def _on_wait(delay: float):
+                status.update(f"[bold yellow]Waiting {delay:.0f}s for the API request limit to be reset ...")
+
             try:
-                response = requests.get(url=self.url, params=self.params, headers=self.headers)
+                for attempt in range(1, self.MAX_ATTEMPTS + 1):
+                    with profiling.span("rate_limit", "network"):
+                        if waited := self.rate_limiter.acquire(on_wait=_on_wait):
+                            metrics.record_rate_limit_wait(waited)
+                    status.update(message)
+                    with profiling.span("http_get", "network") as args:
+                        response = http_session.get(url=self.url, params=self.params, headers=self.headers)
+                        args["bytes"] = response.timing.size
+                    self.timing = response.timing
+                    metrics.record_request(self.path, response.status_code, self.timing.size, self.timing.total)
+                    if self.SHOW_REQUEST_TIMING:
+                        Console(stderr=True).print(f"[dim]GET {response.url} ({response.status_code}): {self.timing}", soft_wrap=True)
+                    if response.status_code == 429 and attempt < self.MAX_ATTEMPTS:
+                        self.rate_limiter.exhaust(response.headers)
+                        continue
+                    self.rate_limiter.update(response.headers)
+                    if cassettes.RECORD:
+                        cassettes.record(self.path, self.params, response.status_code, response.text, self.timing.total)
+                    break
                 response.raise_for_status()
+                data = response.json()
                 if self.SAVE_API_RESPONSE:
-                    save_json(response.json(), "response.json")
-                return response.json()
+                    save_json(data, "response.json")
+                self._cache_later(data)
+                return data
             except requests.exceptions.ConnectionError:
+                metrics.record_request(self.path, "error")
                 raise ConnectionError()
             except requests.exceptions.HTTPError as e:
                 raise HTTPError(e)
             except requests.exceptions.RequestException as e:
+                metrics.record_request(self.path, "error")
                 raise RequestError(e)
 
     @classmethod
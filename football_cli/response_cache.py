@@ -0,0 +1,162 @@
+import os
+import re
+import json
+import time
+import hashlib
+from datetime import date
+from typing import Any, Optional
+from dotenv import load_dotenv
+from utils import DATA_DIR
+
+
+load_dotenv()
+
+
+class CachePolicy:
+    """Decide how long an API response stays fresh based on the request path and parameters.
+
+    TTL values are in seconds, where `None` means the response never expires.
+    """
+
+    PERMANENT = None
+    SHORT = 30              # live scores and today's matches
+    MEDIUM = 24 * 60 * 60   # team info and squads
+    DEFAULT = 10 * 60       # anything else (current season standings, scorers, ...)
+
+    TEAM_PATH = re.compile(r"^teams/\d+$")
+    MATCHES_PATH = re.compile(r"(^|/)matches$")     # e.g. `matches`, `competitions/PL/matches` and `teams/65/matches`
+
+    @classmethod
+    def get_ttl(cls, path: str, params: dict[str, str]) -> Optional[int]:
+        """Return time-to-live of a response.
+
+        :param path: request path relative to the base URL
+        :param params: normalized request parameters
+
+        :return: TTL in seconds or `None` if the response never expires
+        """
+        status = params.get("status", "")
+        if "LIVE" in status:
+            return cls.SHORT
+
+        if cls.TEAM_PATH.match(path):
+            return cls.MEDIUM
+
+        today = date.today().isoformat()
+        if "season" in params and cls.is_past_season(params["season"]):
+            return cls.PERMANENT
+        if cls.MATCHES_PATH.search(path) and cls.includes_today(params, today):
+            return cls.SHORT
+        if params.get("dateTo") and params["dateTo"] <= today:        # exclusive end date
+            return cls.PERMANENT
+        if params.get("date") and params["date"] < today:
+            return cls.PERMANENT
+
+        return cls.DEFAULT
+
+    @staticmethod
+    def includes_today(params: dict[str, str], today: str) -> bool:
+        """Check whether requested matches may include today's matches.
+
+        Matches of today are requested by default (no dates, e.g. `football matches` or the current season's matches),
+        or explicitly by date or time frame.
+
+        :param today: today's date in ISO format
+        """
+        if "date" in params:
+            return params["date"] in ["TODAY", today]
+        if "dateFrom" in params or "dateTo" in params:
+            return params.get("dateFrom", today) <= today <= params.get("dateTo", today)
+        return True
+
+    @staticmethod
+    def is_past_season(season: str) -> bool:
+        """Check whether a season (start year) is over.
+
+        Seasons may span two years, so a season is only considered over if it started at least two years ago.
+        """
+        try:
+            return int(season) + 1 < date.today().year
+        except ValueError:
+            return False
+
+
+class ResponseCache:
+    """Disk-backed cache of API responses under `data/cache`.
+
+    Each entry is stored in a separate JSON file named after the digest of the request path and its parameters.
+    Entries record whether a model was validated from the response (see `RequestHandler.parse`),
+    in which case it can be decoded without validation.
+    """
+
+    ENABLED = os.getenv("USE_RESPONSE_CACHE", "1") == "1"
+    CACHE_DIR = os.path.join(DATA_DIR, "cache")
+
+    def __init__(self, path: str, params: dict[str, Any] = {}):
+        self.path = path.strip("/")
+        self.params = self.normalize_params(params)
+        self.key = self.get_key(self.path, self.params)
+        self.filepath = os.path.join(self.CACHE_DIR, f"{self.key}.json")
+        self.expires_at: Optional[float] = None
+        self.validated = False      # whether the last response read from or written to the cache was validated
+
+    def get(self) -> Optional[dict[str, Any]]:
+        """Return cached response if it exists and hasn't expired yet, `None` otherwise."""
+        if not self.ENABLED:
+            return None
+        try:
+            with open(self.filepath, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        self.expires_at, self.validated = expires_at, entry.get("validated", False)
+        return entry.get("data")
+
+    def set(self, data: dict[str, Any], validated: bool = False):
+        """Store a response with an expiry time derived from `CachePolicy`.
+
+        :param validated: whether a model was validated from the response
+        """
+        if not self.ENABLED:
+            return
+        ttl = CachePolicy.get_ttl(self.path, self.params)
+        self._write(data, None if ttl is None else time.time() + ttl, validated)
+
+    def mark_validated(self, data: dict[str, Any]):
+        """Record that a model was validated from the cached response (keeping its expiry time)."""
+        if not self.ENABLED:
+            return
+        self._write(data, self.expires_at, True)
+
+    def _write(self, data: dict[str, Any], expires_at: Optional[float], validated: bool):
+        entry = {
+            "path": self.path,
+            "params": self.params,
+            "expires_at": expires_at,
+            "validated": validated,
+            "data": data,
+        }
+        self.expires_at, self.validated = expires_at, validated
+        tmp_filepath = f"{self.filepath}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(tmp_filepath, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_filepath, self.filepath)     # atomic, so that concurrent readers never see partial entries
+        except OSError:     # e.g. read-only installation, the response just isn't cached
+            pass
+
+    @staticmethod
+    def normalize_params(params: dict[str, Any]) -> dict[str, str]:
+        """Convert parameter values to strings (as sent in the query string) and sort them by name."""
+        return {key: str(params[key]) for key in sorted(params)}
+
+    @staticmethod
+    def get_key(path: str, params: dict[str, str]) -> str:
+        """Return a digest identifying a request."""
+        raw = json.dumps([path, params], separators=(",", ":"))
+        return hashlib.sha256(raw.encode()).hexdigest()
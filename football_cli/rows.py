@@ -0,0 +1,85 @@
+"""Compact rows rendered by the formatting layer (see `output_formation`).
+
+Rows only keep the attributes used for grouping and the display strings of their cells (computed once, when the
+row is created), so that large responses can be rendered without keeping their models alive. Styles are applied
+by the formatting layer.
+"""
+
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+from utils import display
+
+if TYPE_CHECKING:   # pydantic is imported when responses are parsed
+    from models import Match, Score, Scorer, TableRecord
+
+
+class MatchRow:
+    """Match score (with extra time and penalties), along with the attributes used to group and label matches."""
+
+    __slots__ = ("id", "status", "date", "time", "competition", "season", "stage", "matchday", "group",
+                 "home_id", "away_id", "home_name", "away_name", "winner", "is_live", "results")
+
+    def __init__(self, match: Match):
+        self.id = match.id
+        self.status = match.status
+        self.date = match.date
+        self.time = match.time
+        self.competition = match.competition
+        self.season = match.season
+        self.stage = match.stage
+        self.matchday = match.matchday
+        self.group = match.group
+        self.home_id = match.homeTeam.id
+        self.away_id = match.awayTeam.id
+        self.home_name = match.homeTeam.name
+        self.away_name = match.awayTeam.name
+        self.winner = match.score.winner
+        self.is_live = match.is_live
+        score = match.score
+        self.results = (    # (label, home goals, away goals) of full time, extra time and penalties (if any)
+            ("", *_goals(score.regularTime or score.fullTime)),
+            *[(label, *_goals(s)) for label, s in [("Extra Time", score.extraTime), ("Penalties", score.penalties)] if s],
+        )
+
+
+def _goals(score: Optional[Score]) -> tuple[str, str]:
+    """Return home and away goals of a score (`-` if they're unknown)."""
+    if not score:
+        return "-", "-"
+    return (str(score.home) if score.home is not None else "-", str(score.away) if score.away is not None else "-")
+
+
+class StandingRow:
+    """Team record in a standings table."""
+
+    __slots__ = ("cells",)
+
+    def __init__(self, record: TableRecord):
+        self.cells = tuple(map(display, (
+            record.position,
+            record.team.fullName,
+            record.playedGames,
+            record.won,
+            record.draw,
+            record.lost,
+            record.goalsFor,
+            record.goalsAgainst,
+            record.goalDifference,
+            record.points,
+        )))
+
+
+class ScorerRow:
+    """Player record in a top scorers table (without rank)."""
+
+    __slots__ = ("cells",)
+
+    def __init__(self, scorer: Scorer):
+        self.cells = tuple(map(display, (
+            scorer.player.name,
+            scorer.team.shortName,
+            scorer.goals,
+            scorer.assists,
+            scorer.penalties,
+            scorer.playedMatches,
+        )))
@@ -1,11 +1,23 @@
+from __future__ import annotations
 import os
 import json
-from typing import Any
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional, Sequence, TYPE_CHECKING
 from datetime import datetime, date, timedelta, timezone
-from rich.panel import Panel
-from rich.table import Table
-from rich.console import RenderableType
 from functools import lru_cache
+from profiling import span
+
+if TYPE_CHECKING:   # rich is only imported where output is rendered (keeps shell completion fast)
+    from rich.table import Table
+    from rich.console import RenderableType
+    from rich.style import StyleType
+    from render_cache import RenderCache
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
 
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
@@ -27,31 +39,70 @@ def load_json(filename: str) -> dict:
     return data
 
 def save_json(data: Any, filename: str):
-    """Save data to a JSON file.
+    """Save data to a JSON file (atomically).
     
     :param data: data object to save
     :param filename: name of the file
     """
     filepath = os.path.join(DATA_DIR, filename)
-    with open(filepath, "w") as f:
+    tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_filepath, "w") as f:
         json.dump(data, f, indent=4)
+    os.replace(tmp_filepath, filepath)     # atomic, so that readers never see a partially written file
+
+
+_thread_locks: dict[str, threading.Lock] = {}
 
 
-def add_rows(table: Table, rows: list[list], styles: dict[str, str] = {}):
+@contextmanager
+def file_lock(filename: str) -> Iterator[None]:
+    """Hold an exclusive lock shared between threads and processes using a lock file.
+
+    If the lock file can't be opened (e.g. read-only installation), only threads of the current process are synchronized.
+
+    :param filename: name of the lock file (under the data directory)
+    """
+    thread_lock = _thread_locks.setdefault(filename, threading.Lock())
+    with thread_lock:
+        try:
+            f = open(os.path.join(DATA_DIR, filename), "a")
+        except OSError:
+            yield
+            return
+        with f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def display(value: Any) -> str:
+    """Return the display string of a table cell value (`N/A` if it's missing)."""
+    return "N/A" if value is None or value == "" else str(value)
+
+
+def add_rows(table: Table, rows: Iterable[Sequence], styles: dict[str, StyleType] = {}, formatted: bool = False):
     """Add rows to a table (`rich.Table`).
 
     :param table: `rich.Table` where to add rows
     :param rows: rows values
     :param styles: row styles dictionary where the key is the row number (1-based) and the value is the row style
         (An optional key named `default` represents the default style applied on rows whose number are not found in the dictionary)
+    :param formatted: whether values are already display strings (e.g. cells of `rows.StandingRow`) or `rich.Text`,
+        which are rendered as they are (display strings of other values are parsed as console markup)
     """
-    for i, row in enumerate(rows):
+    from rich.text import Text
+
+    default_style = styles.get("default")
+    for idx, row in enumerate(rows, start=1):
         if not row:
             continue
-        idx = i + 1
-        defualt_style = styles.get("default")
-        style = styles.get(str(idx), defualt_style)
-        table.add_row(*map(lambda x: str(x) if x not in [None, ""] else "N/A", row), style=style)
+        style = styles.get(str(idx), default_style)
+        cells = [Text(value) if isinstance(value, str) else value for value in row] if formatted else map(display, row)
+        table.add_row(*cells, style=style)
 
 
 def add_columns(table: Table, columns: dict[str, dict[str, Any]]):
@@ -107,4 +158,64 @@ def date_from_offset(offset: int, end=False) -> str:
 
 def no_result(message: str = "No Available Data") -> RenderableType:
     """Output of the script in case of no results returned from the API."""
+    from rich.panel import Panel
+
     return Panel(message, border_style="white dim", style="red bold")
+
+
+def print_output(output: RenderableType, cache: Optional[RenderCache] = None, **kwargs):
+    """Print command output to the terminal.
+
+    :param cache: render cache where to store the rendered output (see `render_cache`)
+    :param kwargs: `rich.Console.print` keyword arguments
+    """
+    from rich.console import Console
+
+    console = Console()
+    with span("print", "rendering"):
+        if cache is None:
+            console.print(output, **kwargs)
+            return
+        with console.capture() as capture:
+            console.print(output, **kwargs)
+        print_rendered(capture.get(), cache)
+
+
+def print_rendered(rendered: str, cache: Optional[RenderCache] = None):
+    """Print command output that was already rendered (e.g. by `parallel_rendering`).
+
+    :param cache: render cache where to store the output (see `render_cache`)
+    """
+    from rich.console import Console
+
+    console = Console()
+    console.file.write(rendered)
+    console.file.flush()
+    if cache is not None:
+        cache.set(rendered)
+
+
+def print_cached(cache: Optional[RenderCache]) -> bool:
+    """Print cached output of a command if any (see `render_cache`).
+
+    :return: whether the output was found in the cache (and printed)
+    """
+    if cache is None or (rendered := cache.get()) is None:
+        return False
+
+    with span("print", "rendering", cached=True):
+        print_rendered(rendered)
+    return True
+
+
+def print_stream(outputs: Iterable[RenderableType], **kwargs):
+    """Print command output to the terminal piece by piece, as soon as each piece is formatted.
+
+    :param kwargs: `rich.Console.print` keyword arguments
+    """
+    from rich.console import Console
+
+    console = Console()
+    for output in outputs:
+        with span("print", "rendering"):
+            console.print(output, **kwargs)
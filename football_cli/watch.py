@@ -0,0 +1,139 @@
+"""Live watch mode (`football matches --live --watch` and `football competition <ID> matches --live --watch`).
+
+Live matches are polled on an adaptive schedule: every `LIVE_INTERVAL` while any match is being played, less often
+while all live matches are at halftime, and only once the next match kicks off when nothing is live.
+Each poll is compared with the previous one, and the output (a `rich.live` display) is only redrawn when
+matches were added, removed or updated (status or score), so that unchanged polls don't flicker the screen.
+
+Requests go through the shared rate limiter and response cache, and polling intervals are long enough to stay below
+the request limit (a request per interval, plus one to find the next kickoff when nothing is live, which is cached).
+Failed polls are retried after `LIVE_INTERVAL`, unless the request itself is rejected (e.g. invalid API key).
+"""
+
+from __future__ import annotations
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
+import rich_click as click
+from request_handler import RequestHandler
+from exception_handling import APIRequestException, HTTPError
+from utils import date_from_offset
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+    from models import Match
+    from rows import MatchRow
+
+
+LIVE_INTERVAL = 30          # seconds, as long as live responses are cached (see `CachePolicy.SHORT`)
+PAUSED_INTERVAL = 3 * 60    # all live matches are at halftime
+IDLE_INTERVAL = 60 * 60     # longest sleep when nothing is live (e.g. no upcoming matches today or tomorrow)
+
+Snapshot = dict[int, tuple]
+
+
+def snapshot(matches: Iterable[MatchRow]) -> Snapshot:
+    """Return the status and results of matches by their ID."""
+    return {match.id: (match.status, match.results) for match in matches}
+
+
+def diff(previous: Snapshot, current: Snapshot) -> set[int]:
+    """Return IDs of matches that were added, removed or updated between two snapshots."""
+    return {id_ for id_ in previous.keys() | current.keys() if previous.get(id_) != current.get(id_)}
+
+
+def next_kickoff(matches: Iterable[Match]) -> Optional[datetime]:
+    """Return the earliest kickoff time of upcoming matches (`None` if there are none).
+
+    It may be in the past if a match is late to kick off (or its status wasn't updated yet).
+    """
+    return min((match.utcDate for match in matches), default=None)
+
+
+def poll_delay(matches: Iterable[MatchRow], kickoff: Optional[datetime], now: datetime) -> float:
+    """Return how long to wait before polling live matches again (in seconds).
+
+    :param kickoff: next kickoff time (only used if no match is live)
+    """
+    statuses = {match.status for match in matches if match.is_live}
+    if statuses - {"PAUSED"}:
+        return LIVE_INTERVAL
+    if statuses:
+        return PAUSED_INTERVAL
+    if kickoff is None:
+        return IDLE_INTERVAL
+    return min(max((kickoff - now).total_seconds(), LIVE_INTERVAL), IDLE_INTERVAL)
+
+
+def is_transient(error: APIRequestException) -> bool:
+    """Check whether a failed request may succeed if retried later.
+
+    Only client errors (HTTP 4xx, e.g. invalid API key or parameters) are permanent, except for exceeding the request
+    limit (HTTP 429).
+    """
+    if isinstance(error, HTTPError) and isinstance(error.status_code, int):
+        return not 400 <= error.status_code < 500 or error.status_code == 429
+    return True     # connection errors, timeouts, ...
+
+
+def validate_watch(ctx: click.Context, status: Optional[str]):
+    """Check that `--watch` is used with `--live`, and that output is rendered with `rich`.
+
+    :raise click.UsageError: if `--watch` is used without `--live`, or with `--output`, `--plain` or `--stream`
+    """
+    if status != "LIVE":
+        raise click.UsageError("--watch can only be used with --live.")
+    root_params = ctx.find_root().params
+    if any(root_params.get(name) for name in ["output_format", "plain", "stream"]):
+        raise click.UsageError("--watch can't be used with --output, --plain or --stream.")
+
+
+def watch_matches(path: str, params: dict[str, Any], render: Callable[[list[MatchRow]], RenderableType]):
+    """Keep showing live matches of a request, updated as they change, until interrupted (Ctrl+C).
+
+    :param path: request path of matches (e.g. `matches` or `competitions/<ID>/matches`)
+    :param params: request parameters of live matches (`status=LIVE`)
+    :param render: function formatting live matches
+    """
+    from rich.align import Align
+    from rich.console import Console, Group
+    from rich.live import Live
+    from rich.text import Text
+    from models import MatchSet
+    from rows import MatchRow
+
+    upcoming_params = {
+        **params, "status": "TIMED", "dateFrom": date_from_offset(0), "dateTo": date_from_offset(1, end=True)
+    }
+
+    def _fetch(params_: dict[str, Any]) -> list[Match]:
+        handler = RequestHandler(path=path, params=params_, show_status=False)     # no spinner inside the live display
+        handler.send_request()
+        return handler.parse(MatchSet).matches
+
+    previous: Optional[Snapshot] = None
+    kickoff: Optional[datetime] = None
+    with Live(console=Console(), auto_refresh=False) as live:
+        try:
+            while True:
+                try:
+                    matches = list(map(MatchRow, _fetch(params)))
+                    upcoming_kickoff = None if any(match.is_live for match in matches) \
+                        else next_kickoff(_fetch(upcoming_params))
+                except APIRequestException as e:     # keep showing the last poll, and retry later
+                    if not is_transient(e):
+                        raise
+                    time.sleep(LIVE_INTERVAL)
+                    continue
+
+                current = snapshot(matches)
+                if previous is None or diff(previous, current) or upcoming_kickoff != kickoff:
+                    status = f"Updated at {datetime.now(timezone.utc):%H:%M:%S %Z}"
+                    if upcoming_kickoff:
+                        status += f" | Next kickoff at {upcoming_kickoff:%Y-%m-%d %H:%M %Z}"
+                    live.update(Group(Align.center(render(matches)), Align.center(Text(status, style="dim"))), refresh=True)
+                previous, kickoff = current, upcoming_kickoff
+
+                time.sleep(poll_delay(matches, kickoff, datetime.now(timezone.utc)))
+        except KeyboardInterrupt:
+            pass
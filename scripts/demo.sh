@@ -6,6 +6,25 @@
 # .
 # .
 # TBH, it's a naive testing script just to make sure everything is working :)
+#
+# Usage: ./scripts/demo.sh [--record | --replay]
+#   --record: record API responses (cassettes) while running the demo
+#   --replay: run the demo offline, against the local stand-in API server serving recorded cassettes
+
+
+case "$1" in
+    --record)
+        export FOOTBALL_CLI_RECORD=1
+        ;;
+    --replay)
+        football_replay --port 8765 > /dev/null &
+        trap "kill $!" EXIT
+        export FOOTBALL_CLI_BASE_URL=http://127.0.0.1:8765/v4
+        export FOOTBALL_CLI_API_KEY=${FOOTBALL_CLI_API_KEY:-replay}     # not checked by the stand-in server
+        export USE_RESPONSE_CACHE=0     # don't mix replayed responses with the real ones
+        sleep 1
+        ;;
+esac
 
 
 commands="
@@ -17,8 +36,6 @@ football competition PL matches --season 2022 --matchday 38
 football competition PL matches --season 2019 --matchday 1
 football competition ELC matches --season 2022 --stage PLAYOFFS
 
-echo 'Waiting 1 minute in order not to hit request limit (10 requests per minute)' && sleep 60
-
 football competition CL standings
 football competition CL matches --group A --matchday 1 --season 2022
 football competition CL matches --stage SEMI_FINALS --stage final --season 2022
@@ -29,8 +46,6 @@ football team MCI matches --last 5 --home --show-id
 football team BOT matches --last
 football team BOT matches --next
 
-echo 'Waiting 1 minute in order not to hit request limit (10 requests per minute)' && sleep 60
-
 football matches --date today
 football matches --live
 football matches --time-frame 2023-05-26 2023-06-03 --competitions PL,PD,SA,BL1,FL1
@@ -0,0 +1,108 @@
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import tempfile
+import textwrap
+import threading
+import subprocess
+import pytest
+import daemon
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLI = textwrap.dedent("""
+    import os
+    import sys
+    import time
+    import click
+    import daemon
+
+    @click.group()
+    def cli():
+        pass
+
+    @cli.command()
+    def cwd():
+        click.echo(os.getcwd())
+
+    @cli.command()
+    def wait():
+        time.sleep(1)
+        click.echo("done")
+
+    @cli.command()
+    def fail():
+        click.echo("failed", err=True)
+        sys.exit(3)
+
+    daemon.serve(cli, sys.argv[1])
+""")
+
+
+@pytest.fixture(scope="module")
+def socket_path():
+    directory = tempfile.mkdtemp()      # short path (Unix socket paths are limited to about 100 characters)
+    path = os.path.join(directory, "daemon.sock")
+    env = {**os.environ, "PYTHONPATH": os.path.join(ROOT, "football_cli")}
+    process = subprocess.Popen([sys.executable, "-c", CLI, path], env=env)
+    try:
+        deadline = time.time() + 30
+        while not daemon.is_running(path):
+            assert process.poll() is None and time.time() < deadline, "the daemon didn't start"
+            time.sleep(0.1)
+        yield path
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _request(socket_path: str, argv: list[str], **request) -> list[tuple[bytes, bytes]]:
+    """Send a request to the daemon and return the frames it sent back."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    request = {"argv": argv, "cwd": os.getcwd(), "settings": daemon.settings(), "env": {}, **request}
+    frames = []
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        daemon._send_frame(sock, b"R", json.dumps(request).encode())
+        while not frames or frames[-1][0] not in [b"X", b"L"]:
+            frames.append(daemon._recv_frame(sock))
+    return frames
+
+
+def test_output_and_exit_code_are_streamed_back(socket_path):
+    assert _request(socket_path, ["fail"]) == [(b"E", b"failed\n"), (b"X", b"3")]
+
+
+def test_command_runs_in_client_directory(socket_path, tmp_path):
+    frames = _request(socket_path, ["cwd"], cwd=str(tmp_path))
+    assert frames == [(b"O", f"{tmp_path}\n".encode()), (b"X", b"0")]
+
+
+def test_different_settings_run_locally(socket_path):
+    settings = {**daemon.settings(), "FOOTBALL_CLI_BASE_URL": "http://127.0.0.1:8765/v4"}
+    assert _request(socket_path, ["cwd"], settings=settings) == [(b"L", b"")]
+
+
+def test_busy_daemon_runs_locally(socket_path):
+    frames = {}
+    thread = threading.Thread(target=lambda: frames.update(wait=_request(socket_path, ["wait"])))
+    thread.start()
+    time.sleep(0.5)
+    assert _request(socket_path, ["cwd"]) == [(b"L", b"")]
+    thread.join()
+    assert frames["wait"] == [(b"O", b"done\n"), (b"X", b"0")]
+
+
+def test_client_forwards_commands(socket_path, capfdbinary, monkeypatch):
+    monkeypatch.delenv("FOOTBALL_CLI_NO_DAEMON", raising=False)
+    assert daemon.forward(["fail"], socket_path) == 3
+    assert capfdbinary.readouterr().err == b"failed\n"
+
+    monkeypatch.setenv("FOOTBALL_CLI_BASE_URL", "http://127.0.0.1:8765/v4")
+    assert daemon.forward(["fail"], socket_path) is None
@@ -0,0 +1,132 @@
+import pytest
+from pydantic import ValidationError
+import decoders
+import payloads
+from models import CompetitionTeams, MatchSet, Standings, Team
+from request_handler import RequestHandler
+from response_cache import ResponseCache
+
+
+@pytest.mark.parametrize("model, payload", [
+    (MatchSet, payloads.match_set(500)),
+    (Standings, payloads.cup_standings(10)),
+    (Team, payloads.squad(30)),
+])
+def test_decoding_matches_validation(model, payload):
+    """Decoding a payload without validation results in the same model as validating it (including derived fields)."""
+    expected, actual = model(**payload), decoders.decode(model, payload)
+    assert actual == expected
+    assert actual.__fields_set__ == expected.__fields_set__
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_entities_are_shared(trusted):
+    """Teams repeated in a response are parsed once per id, into immutable models."""
+    payload = payloads.match_set(500)
+    matches = MatchSet.from_response(payload, trusted=trusted).matches
+    teams = [team for match in matches for team in (match.homeTeam, match.awayTeam)]
+    assert len({id(team) for team in teams}) == len({team.id for team in teams})
+    with pytest.raises(TypeError):
+        teams[0].name = "Renamed"
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_compact_references_are_not_shared_with_full_objects(trusted):
+    """A compact reference to a team (e.g. the winner of a season) doesn't replace the full team with the same id."""
+    team = payloads.squad(5)
+    reference = {key: team[key] for key in ["id", "name", "shortName", "tla", "crest"]}
+    payload = {
+        "count": 1,
+        "competition": {"id": 2021, "name": "Premier League", "code": "PL", "type": "LEAGUE", "emblem": None},
+        "season": {"id": 1490, "startDate": "2022-08-05", "endDate": "2023-05-28", "winner": reference},
+        "teams": [team],
+    }
+    expected = CompetitionTeams(**payload)
+    parsed = CompetitionTeams.from_response(payload, trusted=trusted)
+    assert parsed == expected
+    assert parsed.teams[0].venue == "Etihad Stadium"
+    assert parsed.season.winner.venue is None
+
+
+def _invalid_match_set() -> dict:
+    payload = payloads.match_set(3)
+    payload["matches"][0]["homeTeam"]["id"] = "not-an-int"
+    payload["matches"][0]["score"]["fullTime"]["home"] = "x"
+    return payload
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResponseCache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(ResponseCache, "ENABLED", True)
+    return tmp_path
+
+
+def _read(path: str = "matches") -> RequestHandler:
+    handler = RequestHandler(path=path)
+    handler.send_request()
+    assert handler.from_cache
+    return handler
+
+
+def test_unvalidated_cache_entries_are_validated(cache_dir):
+    """Responses are cached before being validated, so invalid ones are rejected when read from the cache."""
+    ResponseCache("matches", {}).set(_invalid_match_set())
+    handler = _read()
+    with pytest.raises(ValidationError):
+        handler.parse(MatchSet)
+
+    cache = ResponseCache("matches", {})
+    assert cache.get() is not None and not cache.validated
+
+
+def test_cache_entries_are_marked_validated(cache_dir):
+    """Once a model is validated from a cached response, later reads of it are decoded without validation."""
+    ResponseCache("matches", {}).set(payloads.match_set(3))
+    expected = _read().parse(MatchSet)
+
+    handler = _read()
+    assert handler.cache.validated
+    assert handler.parse(MatchSet) == expected
+
+
+@pytest.fixture
+def writes(cache_dir, monkeypatch) -> list[bool]:
+    """Serve responses from a fake API, and record writes to the cache (whether each entry was validated)."""
+    import http_session
+    from rate_limiter import RateLimiter
+
+    class Response:
+        status_code, headers, url, text = 200, {}, "matches", ""
+        timing = http_session.RequestTiming()
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return payloads.match_set(3)
+
+    writes = []
+    write = ResponseCache._write
+    monkeypatch.setattr(http_session, "get", lambda **kwargs: Response())
+    monkeypatch.setattr(RateLimiter, "acquire", lambda self, on_wait=None: 0.0)
+    monkeypatch.setattr(RateLimiter, "update", lambda self, headers: None)
+    monkeypatch.setattr(ResponseCache, "_write", lambda self, data, expires_at, validated: (
+        writes.append(validated), write(self, data, expires_at, validated)))
+    return writes
+
+
+def test_received_responses_are_cached_once_validated(writes):
+    handler = RequestHandler(path="matches")
+    handler.send_request()
+    assert not handler.from_cache and writes == []
+    handler.parse(MatchSet)
+    assert writes == [True]
+    assert _read().cache.validated
+
+
+def test_received_responses_are_cached_without_parsing(writes):
+    """Responses are cached even if they're never parsed (e.g. output found in the render cache)."""
+    RequestHandler(path="matches").send_request()
+    assert writes == [False]
+    assert not _read().cache.validated
@@ -0,0 +1,35 @@
+import payloads
+from rich.console import Group
+from rich.panel import Panel
+from models import MatchSet
+from output_formation import format_matches, stream_matches
+from rows import MatchRow
+
+MATCHES_GROUP_BY = ["date", "competition", "season", "stage", "matchday", "group"]
+COMPETITION_GROUP_BY = ["competition", "season", "stage", "matchday", "group"]
+
+
+def _matches() -> list[MatchRow]:
+    matches = list(map(MatchRow, MatchSet(**payloads.match_set(200, days=5)).matches))
+    return sorted(matches, key=lambda match: match.date)
+
+
+def _panels(output: Group) -> list[tuple[str, int]]:
+    """Return titles of the top-level panels of formatted matches, along with the number of their sub-panels."""
+    return [(panel.title, len(panel.renderable.renderables)) for panel in output.renderables if isinstance(panel, Panel)]
+
+
+def test_streamed_output_has_the_same_panels():
+    matches = _matches()
+    streamed = list(stream_matches(matches, MATCHES_GROUP_BY, ["time"]))
+    assert len(streamed) == 5
+    panels = [panel for output in streamed for panel in _panels(output)]
+    assert panels == _panels(format_matches(matches, group_by=MATCHES_GROUP_BY, headers=["time"]))
+
+
+def test_single_top_level_group_is_streamed_at_once():
+    matches = _matches()
+    matches = [match for match in matches if match.competition == matches[0].competition]
+    streamed = list(stream_matches(matches, COMPETITION_GROUP_BY, ["date", "time"]))
+    assert len(streamed) == 1
+    assert _panels(streamed[0]) == _panels(format_matches(matches, group_by=COMPETITION_GROUP_BY, headers=["date", "time"]))
@@ -0,0 +1,67 @@
+import os
+import pytest
+import rate_limiter
+import utils
+from rate_limiter import RateLimiter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.sleeps = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter.time, "time", clock.time)
+    monkeypatch.setattr(rate_limiter.time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture
+def limiter(tmp_path, monkeypatch) -> RateLimiter:
+    monkeypatch.setattr(utils, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(RateLimiter, "STATE_FILE", str(tmp_path / "rate_limit.json"))
+    monkeypatch.setattr(RateLimiter, "REQUESTS_PER_MINUTE", 2)
+    monkeypatch.setattr(RateLimiter, "_memory_state", None)
+    return RateLimiter()
+
+
+def test_bucket_is_refilled_when_quota_is_reset(limiter, clock):
+    assert limiter.acquire() == 0 and limiter.acquire() == 0
+    assert limiter.acquire() == RateLimiter.PERIOD     # waits for the reset, then takes a refilled token
+    assert clock.sleeps == [RateLimiter.PERIOD]
+    assert limiter._load_state()["tokens"] == 1
+
+
+def test_bucket_is_synced_with_headers(limiter, clock):
+    limiter.update({"X-Requests-Available-Minute": "0", "X-RequestCounter-Reset": "12"})
+    state = limiter._load_state()
+    assert state["capacity"] == 2 and state["tokens"] == 0 and state["reset_at"] == clock.now + 12
+    assert limiter.acquire() == 12
+
+    limiter.update({"X-Requests-Available-Minute": "29", "X-RequestCounter-Reset": "60"})   # higher quota of the key
+    assert limiter._load_state()["capacity"] == 30
+
+
+def test_rejected_request_empties_bucket(limiter, clock):
+    assert limiter.exhaust({"X-RequestCounter-Reset": "7"}) == 7
+    assert limiter._load_state()["tokens"] == 0
+    assert limiter.acquire() == 7
+
+
+def test_read_only_installation_limits_requests_in_memory(limiter, clock, tmp_path, monkeypatch):
+    missing = str(tmp_path / "missing")
+    monkeypatch.setattr(utils, "DATA_DIR", missing)
+    monkeypatch.setattr(RateLimiter, "STATE_FILE", os.path.join(missing, "rate_limit.json"))
+    assert limiter.acquire() == 0 and limiter.acquire() == 0
+    assert limiter.acquire() == RateLimiter.PERIOD
+    assert not os.path.exists(missing)
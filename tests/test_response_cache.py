@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+import pytest
+from response_cache import CachePolicy, ResponseCache
+
+
+def _day(offset: int) -> str:
+    return (date.today() + timedelta(days=offset)).isoformat()
+
+
+@pytest.mark.parametrize("path, params", [
+    ("matches", {}),
+    ("matches", {"date": _day(0)}),
+    ("matches", {"date": "TODAY"}),
+    ("matches", {"dateFrom": _day(-1), "dateTo": _day(2)}),
+    ("matches", {"status": "LIVE"}),
+    ("competitions/PL/matches", {}),
+    ("competitions/PL/matches", {"season": str(date.today().year)}),
+    ("competitions/PL/matches", {"status": "LIVE"}),
+    ("teams/65/matches", {"status": "FINISHED"}),
+])
+def test_today_is_short(path, params):
+    assert CachePolicy.get_ttl(path, params) == CachePolicy.SHORT
+
+
+@pytest.mark.parametrize("path, params", [
+    ("competitions/PL/matches", {"season": str(date.today().year - 3)}),
+    ("competitions/PL/standings", {"season": str(date.today().year - 3)}),
+    ("matches", {"date": _day(-1)}),
+    ("matches", {"dateFrom": _day(-7), "dateTo": _day(-1)}),
+])
+def test_past_is_permanent(path, params):
+    assert CachePolicy.get_ttl(path, params) is CachePolicy.PERMANENT
+
+
+@pytest.mark.parametrize("path, params", [
+    ("matches", {"date": _day(1)}),
+    ("matches", {"dateFrom": _day(1), "dateTo": _day(8)}),
+    ("competitions/PL/standings", {}),
+    ("competitions/PL/scorers", {"limit": "10"}),
+])
+def test_future_and_current_season_is_default(path, params):
+    assert CachePolicy.get_ttl(path, params) == CachePolicy.DEFAULT
+
+
+def test_team_info_is_medium():
+    assert CachePolicy.get_ttl("teams/65", {}) == CachePolicy.MEDIUM
+
+
+def test_unwritable_cache_is_skipped(tmp_path, monkeypatch):
+    (tmp_path / "data").write_text("")     # the cache directory can't be created under a file
+    monkeypatch.setattr(ResponseCache, "CACHE_DIR", str(tmp_path / "data" / "cache"))
+    monkeypatch.setattr(ResponseCache, "ENABLED", True)
+    cache = ResponseCache("matches", {"status": "FINISHED"})
+    cache.set({"matches": []})
+    assert cache.get() is None
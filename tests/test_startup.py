@@ -0,0 +1,36 @@
+import os
+import re
+import sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time of the CLI module (before argument parsing), in milliseconds
+IMPORT_BUDGET_MS = int(os.getenv("FOOTBALL_CLI_IMPORT_BUDGET_MS", 300))
+
+# Modules that are only imported once a command is dispatched (or a request is sent)
+DEFERRED_MODULES = ["pydantic", "requests", "models", "commands.competition", "commands.team", "commands.matches"]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import a module in a new interpreter and return the cumulative import time of every module it loaded (in µs)."""
+    env = {**os.environ, "PYTHONPATH": os.path.join(ROOT, "football_cli")}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if match := re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)$", line):
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+def test_heavy_imports_are_deferred():
+    """Importing the CLI (e.g. for `--help` or shell completion) doesn't load models, pydantic, requests or commands."""
+    times = _import_times("main")
+    assert not set(DEFERRED_MODULES) & times.keys()
+
+
+def test_import_time_budget():
+    """Importing the CLI stays within its time budget (best of a few runs, to rule out noise)."""
+    best = min(_import_times("main")["main"] for _ in range(3))
+    assert best / 1000 <= IMPORT_BUDGET_MS, f"importing the CLI took {best / 1000:.0f} ms"
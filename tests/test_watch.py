@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import pytest
+import requests
+import watch
+from exception_handling import ConnectionError, HTTPError, RequestError
+from watch import IDLE_INTERVAL, LIVE_INTERVAL, PAUSED_INTERVAL, poll_delay
+
+NOW = datetime(2024, 5, 19, 14, 0, tzinfo=timezone.utc)
+
+
+def _match(status: str) -> SimpleNamespace:
+    return SimpleNamespace(status=status, is_live=status in ["LIVE", "IN_PLAY", "PAUSED"])
+
+
+@pytest.mark.parametrize("statuses, kickoff, delay", [
+    (["IN_PLAY", "PAUSED"], None, LIVE_INTERVAL),
+    (["PAUSED", "PAUSED"], None, PAUSED_INTERVAL),
+    ([], None, IDLE_INTERVAL),
+    ([], NOW + timedelta(minutes=20), 20 * 60),
+    ([], NOW + timedelta(seconds=5), LIVE_INTERVAL),       # late kickoffs are polled at the live interval
+    ([], NOW + timedelta(days=1), IDLE_INTERVAL),
+    (["FINISHED"], NOW - timedelta(minutes=5), LIVE_INTERVAL),
+])
+def test_poll_delay(statuses, kickoff, delay):
+    assert poll_delay(list(map(_match, statuses)), kickoff, NOW) == delay
+
+
+def _http_error(status_code: int, body: bytes = b'{"message": "error"}') -> HTTPError:
+    response = requests.Response()
+    response.status_code, response._content = status_code, body
+    return HTTPError(requests.HTTPError(response=response))
+
+
+@pytest.mark.parametrize("error, transient", [
+    (ConnectionError(), True),
+    (RequestError(requests.Timeout("timed out")), True),
+    (_http_error(503, b"<html>Service Unavailable</html>"), True),
+    (_http_error(429), True),
+    (_http_error(400), False),
+    (_http_error(403), False),
+])
+def test_transient_errors(error, transient):
+    assert watch.is_transient(error) == transient
+
+
+class FakeHandler:
+    """Request handler failing with the next error of a list, then returning no live matches."""
+
+    errors = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def send_request(self):
+        if self.errors:
+            raise self.errors.pop(0)
+
+    def parse(self, model):
+        return SimpleNamespace(matches=[])
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Delays of polls, until the third one which interrupts watching."""
+    sleeps = []
+
+    def sleep(seconds: float):
+        sleeps.append(seconds)
+        if len(sleeps) == 3:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch, "RequestHandler", FakeHandler)
+    monkeypatch.setattr(watch.time, "sleep", sleep)
+    return sleeps
+
+
+def test_transient_errors_are_retried(sleeps, monkeypatch):
+    monkeypatch.setattr(FakeHandler, "errors", [_http_error(502), RequestError(requests.Timeout("timed out"))])
+    watch.watch_matches("matches", {"status": "LIVE"}, render=lambda matches: "")
+    assert sleeps == [LIVE_INTERVAL, LIVE_INTERVAL, IDLE_INTERVAL]
+
+
+def test_rejected_requests_stop_watching(sleeps, monkeypatch):
+    monkeypatch.setattr(FakeHandler, "errors", [_http_error(403)])
+    with pytest.raises(HTTPError):
+        watch.watch_matches("matches", {"status": "LIVE"}, render=lambda matches: "")
+    assert sleeps == []